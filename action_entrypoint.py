@@ -5,135 +5,191 @@ QWED-Legal GitHub Action Entrypoint
 Runs legal verification based on inputs and sets GitHub Action outputs.
 """
 
+import argparse
 import json
 import os
 import sys
-
-from qwed_legal import DeadlineGuard, LiabilityGuard, ClauseGuard, CitationGuard
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 def set_output(name: str, value: str):
     """Set GitHub Action output using heredoc delimiter format."""
+    set_outputs([(name, value)])
+
+
+def set_outputs(outputs: List[Tuple[str, str]]):
+    """Set several GitHub Action outputs with a single append to GITHUB_OUTPUT."""
     output_file = os.environ.get("GITHUB_OUTPUT")
     if output_file:
-        # Sanitize the output name (no newlines)
-        safe_name = name.replace("\r", "").replace("\n", "")
-        # Use heredoc delimiter to prevent newline injection
-        delimiter = "ghadelimiter_qwed"
-        while delimiter in value:
-            delimiter += "_x"
+        chunks = []
+        for name, value in outputs:
+            # Sanitize the output name (no newlines)
+            safe_name = name.replace("\r", "").replace("\n", "")
+            # Use heredoc delimiter to prevent newline injection
+            delimiter = "ghadelimiter_qwed"
+            while delimiter in value:
+                delimiter += "_x"
+            chunks.append(f"{safe_name}<<{delimiter}\n{value}\n{delimiter}\n")
         with open(output_file, "a", encoding="utf-8") as f:
-            f.write(f"{safe_name}<<{delimiter}\n{value}\n{delimiter}\n")
+            f.write("".join(chunks))
     else:
-        print(f"::set-output name={name}::{value}")
+        for name, value in outputs:
+            print(f"::set-output name={name}::{value}")
+
+
+# Positional order matches the ``args`` list in action.yml.
+_POSITIONAL_ARGS = (
+    "mode",
+    "signing_date",
+    "term",
+    "claimed_deadline",
+    "contract_value",
+    "cap_percentage",
+    "claimed_cap",
+    "clauses_json",
+    "citation",
+    "country",
+    "state",
+)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse the positional action inputs. Empty inputs are treated as unset."""
+    parser = argparse.ArgumentParser(add_help=False)
+    for name in _POSITIONAL_ARGS:
+        parser.add_argument(name, nargs="?")
+    # "--" keeps inputs that begin with "-" from being read as options;
+    # extra trailing arguments are ignored, as before.
+    args, _ = parser.parse_known_args(["--", *argv])
+    for name in _POSITIONAL_ARGS:
+        setattr(args, name, getattr(args, name) or None)
+    args.mode = args.mode or "all"
+    args.country = args.country or "US"
+    return args
+
+
+# Each handler runs one verification mode and returns whether it passed, or
+# None when its inputs were not provided. Guards are imported per handler so
+# a run only loads what it uses (e.g. citation-only runs never import Z3).
+
+
+def _do_deadline(args, results: Dict[str, Any], messages: List[str]) -> Optional[bool]:
+    if not (args.signing_date and args.term and args.claimed_deadline):
+        return None
+    from qwed_legal import DeadlineGuard
+
+    guard = DeadlineGuard(country=args.country, state=args.state)
+    result = guard.verify(args.signing_date, args.term, args.claimed_deadline)
+    results["deadline"] = {
+        "verified": result.verified,
+        "computed": (
+            result.computed_deadline.isoformat()
+            if result.computed_deadline
+            else None
+        ),
+        "claimed": args.claimed_deadline,
+        "difference_days": result.difference_days,
+        "message": result.message,
+    }
+    messages.append(result.message)
+    print(result.message)
+    return result.verified
+
+
+def _do_liability(args, results: Dict[str, Any], messages: List[str]) -> Optional[bool]:
+    if not (args.contract_value and args.cap_percentage and args.claimed_cap):
+        return None
+    from qwed_legal import LiabilityGuard
+
+    guard = LiabilityGuard()
+    result = guard.verify_cap(
+        float(args.contract_value), float(args.cap_percentage), float(args.claimed_cap)
+    )
+    results["liability"] = {
+        "verified": result.verified,
+        "computed": float(result.computed_cap),
+        "claimed": float(args.claimed_cap),
+        "difference": float(result.difference),
+        "message": result.message,
+    }
+    messages.append(result.message)
+    print(result.message)
+    return result.verified
+
+
+def _do_clause(args, results: Dict[str, Any], messages: List[str]) -> Optional[bool]:
+    if not args.clauses_json:
+        return None
+    from qwed_legal import ClauseGuard
+
+    try:
+        clauses = json.loads(args.clauses_json)
+        guard = ClauseGuard()
+        result = guard.check_consistency(clauses)
+        results["clause"] = {
+            "consistent": result.consistent,
+            "status": result.status,
+            "conflicts": [(c[0], c[1], c[2]) for c in result.conflicts],
+            "message": result.message,
+        }
+        messages.append(result.message)
+        print(result.message)
+        # heuristic_pass_limited = guard has no coverage, not a detected
+        # contradiction — do NOT fail CI for this case.
+        return result.status != "contradiction"
+    except json.JSONDecodeError as e:
+        results["clause"] = {"error": f"Invalid JSON: {e}"}
+        return False
+
+
+def _do_citation(args, results: Dict[str, Any], messages: List[str]) -> Optional[bool]:
+    if not args.citation:
+        return None
+    from qwed_legal import CitationGuard
+
+    guard = CitationGuard()
+    result = guard.verify(args.citation)
+    results["citation"] = {
+        "valid": result.valid,
+        "citation_type": result.citation_type,
+        "parsed": result.parsed_components,
+        "issues": result.issues,
+        "message": result.message,
+    }
+    messages.append(result.message)
+    print(result.message)
+    return result.valid
+
+
+# Run order for mode "all" is the insertion order of this table.
+HANDLERS: Dict[str, Callable[..., Optional[bool]]] = {
+    "deadline": _do_deadline,
+    "liability": _do_liability,
+    "clause": _do_clause,
+    "citation": _do_citation,
+}
 
 
 def main():
-    args = sys.argv[1:]
-
-    # Parse arguments
-    mode = args[0] if len(args) > 0 and args[0] else "all"
-    signing_date = args[1] if len(args) > 1 and args[1] else None
-    term = args[2] if len(args) > 2 and args[2] else None
-    claimed_deadline = args[3] if len(args) > 3 and args[3] else None
-    contract_value = args[4] if len(args) > 4 and args[4] else None
-    cap_percentage = args[5] if len(args) > 5 and args[5] else None
-    claimed_cap = args[6] if len(args) > 6 and args[6] else None
-    clauses_json = args[7] if len(args) > 7 and args[7] else None
-    citation = args[8] if len(args) > 8 and args[8] else None
-    country = args[9] if len(args) > 9 and args[9] else "US"
-    state = args[10] if len(args) > 10 and args[10] else None
+    args = parse_args(sys.argv[1:])
 
     results = {}
     all_verified = True
     messages = []
 
-    # Deadline verification
-    if mode in ["deadline", "all"] and signing_date and term and claimed_deadline:
-        guard = DeadlineGuard(country=country, state=state)
-        result = guard.verify(signing_date, term, claimed_deadline)
-        results["deadline"] = {
-            "verified": result.verified,
-            "computed": (
-                result.computed_deadline.isoformat()
-                if result.computed_deadline
-                else None
-            ),
-            "claimed": claimed_deadline,
-            "difference_days": result.difference_days,
-            "message": result.message,
-        }
-        if not result.verified:
-            all_verified = False
-        messages.append(result.message)
-        print(result.message)
-
-    # Liability verification
-    if (
-        mode in ["liability", "all"]
-        and contract_value
-        and cap_percentage
-        and claimed_cap
-    ):
-        guard = LiabilityGuard()
-        result = guard.verify_cap(
-            float(contract_value), float(cap_percentage), float(claimed_cap)
-        )
-        results["liability"] = {
-            "verified": result.verified,
-            "computed": float(result.computed_cap),
-            "claimed": float(claimed_cap),
-            "difference": float(result.difference),
-            "message": result.message,
-        }
-        if not result.verified:
-            all_verified = False
-        messages.append(result.message)
-        print(result.message)
-
-    # Clause verification
-    if mode in ["clause", "all"] and clauses_json:
-        try:
-            clauses = json.loads(clauses_json)
-            guard = ClauseGuard()
-            result = guard.check_consistency(clauses)
-            results["clause"] = {
-                "consistent": result.consistent,
-                "status": result.status,
-                "conflicts": [(c[0], c[1], c[2]) for c in result.conflicts],
-                "message": result.message,
-            }
-            # heuristic_pass_limited = guard has no coverage, not a detected
-            # contradiction — do NOT fail CI for this case.
-            if result.status == "contradiction":
+    for name, handler in HANDLERS.items():
+        if args.mode in (name, "all"):
+            if handler(args, results, messages) is False:
                 all_verified = False
-            messages.append(result.message)
-            print(result.message)
-        except json.JSONDecodeError as e:
-            results["clause"] = {"error": f"Invalid JSON: {e}"}
-            all_verified = False
-
-    # Citation verification
-    if mode in ["citation", "all"] and citation:
-        guard = CitationGuard()
-        result = guard.verify(citation)
-        results["citation"] = {
-            "valid": result.valid,
-            "citation_type": result.citation_type,
-            "parsed": result.parsed_components,
-            "issues": result.issues,
-            "message": result.message,
-        }
-        if not result.valid:
-            all_verified = False
-        messages.append(result.message)
-        print(result.message)
 
     # Set outputs
-    set_output("verified", str(all_verified).lower())
-    set_output("results", json.dumps(results))
-    set_output(
-        "message", " | ".join(messages) if messages else "No verification performed"
+    set_outputs(
+        [
+            ("verified", str(all_verified).lower()),
+            # Compact separators: the payload is machine-read by later workflow steps.
+            ("results", json.dumps(results, separators=(",", ":"))),
+            ("message", " | ".join(messages) if messages else "No verification performed"),
+        ]
     )
 
     # Exit with error if verification failed
@@ -6,22 +6,41 @@ Catches date calculation errors, contradictory clauses, liability miscalculation
 and ensures AI content provenance compliance.
 """
 
-from typing import Optional
-
-from qwed_legal.guards.deadline_guard import DeadlineGuard
-from qwed_legal.guards.liability_guard import LiabilityGuard
-from qwed_legal.guards.clause_guard import ClauseGuard
-from qwed_legal.guards.citation_guard import CitationGuard
-from qwed_legal.guards.jurisdiction_guard import JurisdictionGuard
-from qwed_legal.guards.statute_guard import StatuteOfLimitationsGuard
-from qwed_legal.guards.irac_guard import IRACGuard
-from qwed_legal.guards.fairness_guard import FairnessGuard
-from qwed_legal.guards.contradiction_guard import ContradictionGuard, Clause
-from qwed_legal.guards.provenance_guard import ProvenanceGuard, ProvenanceRecord
-from qwed_legal.models import VerificationStep, trace_to_dict
-from qwed_legal.rag.sac_processor import SACProcessor
+import importlib
+from typing import TYPE_CHECKING, Optional
+
+from qwed_legal import guards as _guards
+
+if TYPE_CHECKING:
+    from qwed_legal.guards import (
+        CitationGuard,
+        Clause,
+        ClauseGuard,
+        ContradictionGuard,
+        DeadlineGuard,
+        FairnessGuard,
+        IRACGuard,
+        JurisdictionGuard,
+        LiabilityGuard,
+        ProvenanceGuard,
+        ProvenanceRecord,
+        StatuteOfLimitationsGuard,
+    )
+    from qwed_legal.models import VerificationStep, trace_to_dict
+    from qwed_legal.rag.sac_processor import SACProcessor
 
 __version__ = "0.4.0"
+
+# Non-guard public name -> defining module. Guard names are passed through to
+# qwed_legal.guards. Both resolve lazily on first attribute access (PEP 562)
+# so that e.g. ``from qwed_legal import CitationGuard`` does not import every
+# guard, and Z3 is only loaded by the guards that use it.
+_LAZY_IMPORTS = {
+    "VerificationStep": "qwed_legal.models",
+    "trace_to_dict": "qwed_legal.models",
+    "SACProcessor": "qwed_legal.rag.sac_processor",
+}
+
 __all__ = [
     "DeadlineGuard",
     "LiabilityGuard",
@@ -42,6 +61,22 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    if name in _guards.__all__:
+        value = getattr(_guards, name)
+    else:
+        module_name = _LAZY_IMPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 class LegalGuard:
     """
     All-in-one legal verification guard.
@@ -60,6 +95,19 @@ class LegalGuard:
     """
 
     def __init__(self, llm_client=None, provenance_config: Optional[dict] = None):
+        from qwed_legal.guards import (
+            CitationGuard,
+            ClauseGuard,
+            ContradictionGuard,
+            DeadlineGuard,
+            FairnessGuard,
+            IRACGuard,
+            JurisdictionGuard,
+            LiabilityGuard,
+            ProvenanceGuard,
+            StatuteOfLimitationsGuard,
+        )
+
         self.deadline = DeadlineGuard()
         self.liability = LiabilityGuard()
         self.clause = ClauseGuard()
@@ -125,7 +173,7 @@ class LegalGuard:
         """Verify that legal reasoning follows IRAC structure."""
         return self.irac.verify_structure(llm_output)
 
-    def verify_contradiction(self, clauses: list[Clause]):
+    def verify_contradiction(self, clauses: "list[Clause]"):
         """Check clauses for logical contradictions using Z3 SMT Solver (ContradictionGuard).
 
         Accepts structured ``Clause`` dataclass instances with ``id``, ``text``,
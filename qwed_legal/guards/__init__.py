@@ -1,15 +1,40 @@
-"""QWED-Legal Guards Module."""
-
-from qwed_legal.guards.deadline_guard import DeadlineGuard
-from qwed_legal.guards.liability_guard import LiabilityGuard
-from qwed_legal.guards.clause_guard import ClauseGuard
-from qwed_legal.guards.citation_guard import CitationGuard
-from qwed_legal.guards.jurisdiction_guard import JurisdictionGuard
-from qwed_legal.guards.statute_guard import StatuteOfLimitationsGuard
-from qwed_legal.guards.irac_guard import IRACGuard
-from qwed_legal.guards.fairness_guard import FairnessGuard
-from qwed_legal.guards.contradiction_guard import ContradictionGuard, Clause
-from qwed_legal.guards.provenance_guard import ProvenanceGuard, ProvenanceRecord
+"""QWED-Legal Guards Module.
+
+Guards are imported lazily on first attribute access (PEP 562), so importing a
+single guard does not load the others — in particular Z3, which only
+ClauseGuard and ContradictionGuard need.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qwed_legal.guards.citation_guard import CitationGuard
+    from qwed_legal.guards.clause_guard import ClauseGuard
+    from qwed_legal.guards.contradiction_guard import Clause, ContradictionGuard
+    from qwed_legal.guards.deadline_guard import DeadlineGuard
+    from qwed_legal.guards.fairness_guard import FairnessGuard
+    from qwed_legal.guards.irac_guard import IRACGuard
+    from qwed_legal.guards.jurisdiction_guard import JurisdictionGuard
+    from qwed_legal.guards.liability_guard import LiabilityGuard
+    from qwed_legal.guards.provenance_guard import ProvenanceGuard, ProvenanceRecord
+    from qwed_legal.guards.statute_guard import StatuteOfLimitationsGuard
+
+# Public name -> defining submodule.
+_LAZY_IMPORTS = {
+    "DeadlineGuard": "qwed_legal.guards.deadline_guard",
+    "LiabilityGuard": "qwed_legal.guards.liability_guard",
+    "ClauseGuard": "qwed_legal.guards.clause_guard",
+    "CitationGuard": "qwed_legal.guards.citation_guard",
+    "JurisdictionGuard": "qwed_legal.guards.jurisdiction_guard",
+    "StatuteOfLimitationsGuard": "qwed_legal.guards.statute_guard",
+    "IRACGuard": "qwed_legal.guards.irac_guard",
+    "FairnessGuard": "qwed_legal.guards.fairness_guard",
+    "ContradictionGuard": "qwed_legal.guards.contradiction_guard",
+    "Clause": "qwed_legal.guards.contradiction_guard",
+    "ProvenanceGuard": "qwed_legal.guards.provenance_guard",
+    "ProvenanceRecord": "qwed_legal.guards.provenance_guard",
+}
 
 __all__ = [
     "DeadlineGuard",
@@ -26,3 +51,15 @@ __all__ = [
     "ProvenanceRecord",
 ]
 
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
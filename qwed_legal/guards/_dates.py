@@ -0,0 +1,50 @@
+"""Date helpers shared by DeadlineGuard and StatuteOfLimitationsGuard."""
+
+import calendar
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Union
+
+from dateutil.parser import parse as parse_date
+
+
+def _parse_date(text: Union[str, date]) -> datetime:
+    """
+    Parse a date string, taking the fast path for plain ISO "YYYY-MM-DD".
+
+    Anything else, including ISO-shaped strings that fail to parse, goes to
+    dateutil, so accepted inputs, results and error messages are unchanged.
+    Already-parsed datetimes pass through; dates become midnight datetimes.
+    String inputs are memoized; datetimes are immutable, so sharing is safe.
+    """
+    if isinstance(text, str):
+        return _parse_date_str(text)
+    if isinstance(text, datetime):
+        return text
+    if isinstance(text, date):
+        return datetime(text.year, text.month, text.day)
+    return parse_date(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(text: str) -> datetime:
+    if len(text) == 10 and text[4] == text[7] == "-":
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    return parse_date(text)
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    """
+    Shift a datetime by whole calendar months, clamping to the month's last day.
+
+    Matches ``dt + relativedelta(months=months)``: 2020-02-29 plus 12 months
+    is 2021-02-28, and the time of day and tzinfo are preserved.
+    """
+    years, month_index = divmod(dt.month - 1 + months, 12)
+    year = dt.year + years
+    month = month_index + 1
+    day = min(dt.day, calendar.monthrange(year, month)[1])
+    return dt.replace(year=year, month=month, day=day)
@@ -22,10 +22,19 @@ IMPORTANT — scope of this guard:
   Authority verification requires an external legal database.
 """
 
+import hashlib
+import json
+import os
 import re
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple
 
+from qwed_legal import __version__
 from qwed_legal.models import (
     VerificationStep,
     STEP_RULE_IDENTIFIED,
@@ -53,8 +62,61 @@ STATUS_UNVERIFIABLE_AUTHORITY = "unverifiable_authority"
 # not just anywhere in the string.
 _V_DOT_RE = re.compile(r"\sv\.\s", re.IGNORECASE)
 
+# Fallback shape of a "volume REPORTER page" fragment. Used only after every
+# known reporter pattern has failed, to distinguish "Unknown reporter" from
+# text that contains no citation-like fragment at all.
+_UNKNOWN_REPORTER_RE = re.compile(r"\d+\s+[A-Z\.]+\s+\d+")
 
-@dataclass
+# Every case reporter family needs at least one digit (volume, year or page).
+# A single C-level scan for one rules out all of them before the fused regex.
+_DIGIT_RE = re.compile(r"\d")
+
+_NAMED_GROUP_RE = re.compile(r"\(\?P<(\w+)>")
+
+# Parsed fields coerced to int by _parse_components(). Built once at import
+# rather than on every call.
+_NUMERIC_FIELDS = frozenset({"volume", "title", "page", "number", "year"})
+
+
+def _fuse_patterns(patterns: Dict[str, str]) -> "re.Pattern[str]":
+    """
+    Fuse named patterns into one regex evaluated with a single match() call.
+
+    Each pattern becomes an optional lookahead anchored at position 0, wrapped
+    in a group named after its key; inner groups are prefixed with that key
+    (``volume`` -> ``US_SCOTUS_volume``). Every family therefore still reports
+    its own leftmost match, exactly as a separate ``search()`` would, so the
+    per-family priority order and "skip and try the next family" semantics of
+    verify() are preserved. A leading global ``(?i)`` is rewritten to a scoped
+    ``(?i:...)`` so it does not leak into the other families.
+    """
+    parts = []
+    for name, pattern in patterns.items():
+        body = pattern
+        if body.startswith("(?i)"):
+            body = f"(?i:{body[4:]})"
+        body = _NAMED_GROUP_RE.sub(lambda m, n=name: f"(?P<{n}_{m.group(1)}>", body)
+        parts.append(rf"(?:(?=[\s\S]*?(?P<{name}>{body})))?")
+    return re.compile("".join(parts))
+
+
+# verify_batch() only fans out to worker processes at or above this many
+# distinct citations; below it, process start-up dominates.
+_PARALLEL_MIN_DISTINCT = 512
+
+
+def _count_format_valid(
+    counts: List[Tuple[str, int]], guard: Optional["CitationGuard"] = None
+) -> int:
+    """Sum the multiplicities of format-valid citations in (citation, count) pairs.
+
+    Module-level so verify_batch() can pickle it to worker processes.
+    """
+    guard = guard or CitationGuard()
+    return sum(n for c, n in counts if guard._is_format_valid(c))
+
+
+@dataclass(frozen=True, slots=True)
 class CitationResult:
     """
     Result of a citation format check.
@@ -74,6 +136,9 @@ class CitationResult:
         issues          — list of format problems found (empty when format_valid=True)
         message         — human-readable explanation of the result
         risk            — optional risk level string
+
+    Instances are frozen and slotted: a result cannot be re-labelled after
+    verify() returns it (e.g. flipping format_valid), and carries no __dict__.
     """
 
     format_valid: bool
@@ -104,7 +169,7 @@ class CitationResult:
         return False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BatchCitationResult:
     """Result of a batch citation format check."""
 
@@ -175,12 +240,63 @@ class CitationGuard:
         "US_CODE": r"(?P<title>\d{1,3})\s+U\.?S\.?C\.?\s+§+\s*(?P<section>[\d\w]+)",
     }
 
-    def __init__(self) -> None:
-        # Compile patterns once at init time (not dynamically at runtime)
-        self._compiled_case = {k: re.compile(v) for k, v in self.CASE_PATTERNS.items()}
-        self._compiled_statute = {
-            k: re.compile(v) for k, v in self.STATUTE_PATTERNS.items()
-        }
+    # Compiled once at class definition and shared by every instance, so
+    # constructing a guard (or verifying a large batch) never recompiles.
+    # Subclasses that override the pattern tables get their own copies
+    # (see __init_subclass__).
+    _COMPILED_CASE: Dict[str, "re.Pattern[str]"] = {
+        k: re.compile(v) for k, v in CASE_PATTERNS.items()
+    }
+    _COMPILED_STATUTE: Dict[str, "re.Pattern[str]"] = {
+        k: re.compile(v) for k, v in STATUTE_PATTERNS.items()
+    }
+
+    # All case reporter families in one regex: a single match() call yields the
+    # leftmost match of every family (see _fuse_patterns). _CASE_GROUPS lists
+    # each family's own group names, in definition order, for unprefixing.
+    _FUSED_CASE: "re.Pattern[str]" = _fuse_patterns(CASE_PATTERNS)
+    _CASE_GROUPS: Dict[str, tuple] = {
+        k: tuple(p.groupindex) for k, p in _COMPILED_CASE.items()
+    }
+
+    # Fixed failure messages, built once from the pattern tables.
+    _UNKNOWN_REPORTER_MESSAGE = (
+        "FORMAT INVALID: Citation contains an unrecognized reporter "
+        f"abbreviation. Supported reporters: {', '.join(CASE_PATTERNS)}."
+    )
+    _INVALID_STATUTE_MESSAGE = (
+        "FORMAT INVALID: No recognized statute citation pattern found. "
+        f"Supported patterns: {', '.join(STATUTE_PATTERNS)}."
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Recompile the derived tables for a subclass that overrides the patterns."""
+        super().__init_subclass__(**kwargs)
+        if "CASE_PATTERNS" in cls.__dict__ or "STATUTE_PATTERNS" in cls.__dict__:
+            cls._COMPILED_CASE = {k: re.compile(v) for k, v in cls.CASE_PATTERNS.items()}
+            cls._COMPILED_STATUTE = {
+                k: re.compile(v) for k, v in cls.STATUTE_PATTERNS.items()
+            }
+            cls._FUSED_CASE = _fuse_patterns(cls.CASE_PATTERNS)
+            cls._CASE_GROUPS = {k: tuple(p.groupindex) for k, p in cls._COMPILED_CASE.items()}
+            cls._UNKNOWN_REPORTER_MESSAGE = (
+                "FORMAT INVALID: Citation contains an unrecognized reporter "
+                f"abbreviation. Supported reporters: {', '.join(cls.CASE_PATTERNS)}."
+            )
+            cls._INVALID_STATUTE_MESSAGE = (
+                "FORMAT INVALID: No recognized statute citation pattern found. "
+                f"Supported patterns: {', '.join(cls.STATUTE_PATTERNS)}."
+            )
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Optional directory for persisting verify_batch() counts,
+                keyed by a hash of the citation list. Useful when the same
+                citation set is re-checked across runs (retries, matrix jobs).
+                Disabled by default; a missing or corrupt entry is recomputed.
+        """
+        self.cache_dir = cache_dir
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -198,42 +314,8 @@ class CitationGuard:
 
         Authority is ALWAYS unverifiable — CitationGuard has no database access.
         """
-        is_statute = "U.S.C." in text or "§" in text
-
-        # Try each case reporter pattern.
-        # Case-name enforcement is per-pattern: US_SCOTUS and US_FED require a
-        # "Party v. Party" prefix; UK_NEUTRAL and INDIA_AIR do not.
-        # We track whether any pattern matched but was skipped due to missing
-        # case name — used to surface the right error message if no pattern succeeds.
-        skipped_for_case_name = False
-        for citation_type, pattern in self._compiled_case.items():
-            match = pattern.search(text)
-            if not match:
-                continue
-
-            # For reporter types that mandate a case name, verify one is present
-            # AND that it appears BEFORE the reporter in the string.
-            # Positional check prevents "347 U.S. 483 Smith v. Jones" from passing
-            # (case name after reporter is not a valid citation prefix).
-            # Use continue (not return): a later pattern may match without case name.
-            if citation_type in self._REQUIRES_CASE_NAME:
-                v_dot = _V_DOT_RE.search(text)
-                # "v." must exist AND appear before the volume number.
-                # Use match.start("volume") — the volume group is always the first
-                # numeric capture and is the true start of the reporter section.
-                # match.start() alone would be 0 because the pattern has an optional
-                # case-name prefix group, making match.start() unreliable here.
-                volume_start = (
-                    match.start("volume")
-                    if "volume" in match.groupdict()
-                    else match.start()
-                )
-                if not v_dot or v_dot.start() >= volume_start:
-                    # No "v." found, or "v." at/after reporter — case name not a prefix
-                    skipped_for_case_name = True
-                    continue
-
-            components = self._parse_components(match.groupdict())
+        citation_type, components, skipped_for_case_name = self._match_case(text)
+        if citation_type is not None:
             return CitationResult(
                 format_valid=True,
                 status=STATUS_UNVERIFIABLE_AUTHORITY,
@@ -256,7 +338,7 @@ class CitationGuard:
         # "347 U.S. 483") and a valid statute citation. A missing case-name
         # fragment should not prevent a later valid statute format from being
         # detected. The result remains FORMAT ONLY / AUTHORITY UNVERIFIABLE.
-        if is_statute:
+        if self._looks_like_statute(text):
             # Let check_statute_citation handle it for a structured result
             return self.check_statute_citation(text)
 
@@ -276,17 +358,13 @@ class CitationGuard:
             )
 
         # Unknown/invalid reporter pattern
-        if re.search(r"\d+\s+[A-Z\.]+\s+\d+", text):
+        if _UNKNOWN_REPORTER_RE.search(text):
             return CitationResult(
                 format_valid=False,
                 status=STATUS_FORMAT_INVALID,
                 citation=text,
                 issues=["Unknown reporter"],
-                message=(
-                    "FORMAT INVALID: Citation contains an unrecognized reporter "
-                    "abbreviation. Supported reporters: "
-                    f"{', '.join(self.CASE_PATTERNS.keys())}."
-                ),
+                message=self._UNKNOWN_REPORTER_MESSAGE,
                 verification_trace=self._format_invalid_trace(text, "Unknown reporter"),
             )
 
@@ -335,54 +413,255 @@ class CitationGuard:
         Same scope as verify(): FORMAT ONLY. Does not confirm the statute section exists
         or has the legal meaning attributed to it.
         """
-        for citation_type, pattern in self._compiled_statute.items():
-            match = pattern.search(text)
-            if match:
-                components = self._parse_components(match.groupdict())
-                return CitationResult(
-                    format_valid=True,
-                    status=STATUS_UNVERIFIABLE_AUTHORITY,
-                    citation=text,
-                    citation_type=citation_type,
-                    parsed_components=components,
-                    message=(
-                        f"FORMAT VALID ({citation_type}): Statute citation matches "
-                        f"the {citation_type} pattern. "
-                        f"AUTHORITY UNVERIFIABLE: CitationGuard cannot confirm "
-                        f"this statute section exists or applies as cited."
-                    ),
-                    verification_trace=self._format_match_trace(citation_type, text),
-                )
+        citation_type, components = self._match_statute(text)
+        if citation_type is not None:
+            return CitationResult(
+                format_valid=True,
+                status=STATUS_UNVERIFIABLE_AUTHORITY,
+                citation=text,
+                citation_type=citation_type,
+                parsed_components=components,
+                message=(
+                    f"FORMAT VALID ({citation_type}): Statute citation matches "
+                    f"the {citation_type} pattern. "
+                    f"AUTHORITY UNVERIFIABLE: CitationGuard cannot confirm "
+                    f"this statute section exists or applies as cited."
+                ),
+                verification_trace=self._format_match_trace(citation_type, text),
+            )
 
         return CitationResult(
             format_valid=False,
             status=STATUS_FORMAT_INVALID,
             citation=text,
             issues=["Invalid statute format"],
-            message=(
-                "FORMAT INVALID: No recognized statute citation pattern found. "
-                f"Supported patterns: {', '.join(self.STATUTE_PATTERNS.keys())}."
-            ),
+            message=self._INVALID_STATUTE_MESSAGE,
             verification_trace=self._format_invalid_trace(text, "Invalid statute format"),
         )
 
-    def verify_batch(self, citations: List[str]) -> BatchCitationResult:
+    def verify_batch(self, citations: List[str], workers: int = 1) -> BatchCitationResult:
         """
         Check a list of citation strings for format validity.
 
         Returns counts of format_valid and format_invalid. Note that format_valid
         citations are NOT verified legal authorities — see verify() for details.
+
+        Args:
+            citations: Citation strings to check.
+            workers: Worker processes to spread large batches over. Batches with
+                fewer than _PARALLEL_MIN_DISTINCT distinct citations always run
+                in-process, where start-up cost would outweigh the gain.
         """
-        valid_count = sum(1 for c in citations if self.verify(c).format_valid)
+        cache_path = self._batch_cache_path(citations) if self.cache_dir else None
+        if cache_path:
+            cached = self._load_batch_cache(cache_path, len(citations))
+            if cached is not None:
+                return cached
+
+        # Briefs repeat the same authorities many times; classify each distinct
+        # string once and weight it by its number of occurrences.
+        counts = list(Counter(citations).items())
+        if workers > 1 and len(counts) >= _PARALLEL_MIN_DISTINCT:
+            size = -(-len(counts) // workers)
+            chunks = [counts[i : i + size] for i in range(0, len(counts), size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                valid_count = sum(
+                    executor.map(_count_format_valid, chunks, repeat(self))
+                )
+        else:
+            valid_count = _count_format_valid(counts, self)
         invalid_count = len(citations) - valid_count
-        return BatchCitationResult(
+        result = BatchCitationResult(
             total=len(citations),
             format_valid=valid_count,
             format_invalid=invalid_count,
         )
+        if cache_path:
+            self._store_batch_cache(cache_path, result)
+        return result
+
+    @classmethod
+    def cache_info(cls):
+        """Hit/miss statistics of the shared citation match cache."""
+        return cls._match_case_cached.cache_info()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Empty the shared citation match caches (e.g. in long-running processes)."""
+        cls._match_case_cached.cache_clear()
+        cls._match_statute_cached.cache_clear()
 
     # ── Private helpers ────────────────────────────────────────────────────────
 
+    def _match_case(self, text: str) -> Tuple[Optional[str], Dict[str, Any], bool]:
+        """
+        Match `text` against the case reporter families, in priority order.
+
+        Returns (citation_type, parsed_components, skipped_for_case_name).
+        citation_type is None when no family produced a format-valid match;
+        skipped_for_case_name is True when a family matched but was rejected
+        because the required "Party v. Party" prefix was missing.
+
+        The match itself is memoized per citation string; parsed_components is
+        a fresh dict on every call, so callers may mutate their result freely.
+        """
+        citation_type, components, skipped_for_case_name = self._match_case_cached(text)
+        return citation_type, dict(components), skipped_for_case_name
+
+    @classmethod
+    @lru_cache(maxsize=8192)
+    def _match_case_cached(
+        cls, text: str
+    ) -> Tuple[Optional[str], Tuple[Tuple[str, Any], ...], bool]:
+        """Memoized body of _match_case(); components are returned as an items tuple.
+
+        Keyed on (class, text), so a subclass with its own patterns never
+        shares entries with the base class.
+        """
+        if not _DIGIT_RE.search(text):
+            return None, (), False
+
+        # Case-name enforcement is per-pattern: US_SCOTUS and US_FED require a
+        # "Party v. Party" prefix; UK_NEUTRAL and INDIA_AIR do not.
+        # We track whether any pattern matched but was skipped due to missing
+        # case name — used to surface the right error message if no pattern succeeds.
+        skipped_for_case_name = False
+        fused = cls._FUSED_CASE.match(text)
+        for citation_type, groups in cls._CASE_GROUPS.items():
+            if fused.group(citation_type) is None:
+                continue
+
+            # For reporter types that mandate a case name, verify one is present
+            # AND that it appears BEFORE the reporter in the string.
+            # Positional check prevents "347 U.S. 483 Smith v. Jones" from passing
+            # (case name after reporter is not a valid citation prefix).
+            # Use continue (not return): a later pattern may match without case name.
+            if citation_type in cls._REQUIRES_CASE_NAME:
+                # Substring test first: _V_DOT_RE needs "v." or "V." to match.
+                v_dot = (
+                    _V_DOT_RE.search(text) if "v." in text or "V." in text else None
+                )
+                # "v." must exist AND appear before the volume number.
+                # Use the family's volume group — the volume group is always the
+                # first numeric capture and is the true start of the reporter
+                # section. The family match start alone would be unreliable
+                # because the pattern has an optional case-name prefix group.
+                volume_start = (
+                    fused.start(f"{citation_type}_volume")
+                    if "volume" in groups
+                    else fused.start(citation_type)
+                )
+                if not v_dot or v_dot.start() >= volume_start:
+                    # No "v." found, or "v." at/after reporter — case name not a prefix
+                    skipped_for_case_name = True
+                    continue
+
+            components = cls._parse_components(
+                {g: fused.group(f"{citation_type}_{g}") for g in groups}
+            )
+            return citation_type, tuple(components.items()), skipped_for_case_name
+
+        return None, (), skipped_for_case_name
+
+    def _match_statute(self, text: str) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Match `text` against the statute patterns, in priority order.
+
+        Returns (citation_type, parsed_components); citation_type is None when
+        no statute pattern matches. Memoized like _match_case(), and
+        parsed_components is likewise a fresh dict on every call.
+        """
+        citation_type, components = self._match_statute_cached(text)
+        return citation_type, dict(components)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _match_statute_cached(
+        cls, text: str
+    ) -> Tuple[Optional[str], Tuple[Tuple[str, Any], ...]]:
+        """Memoized body of _match_statute(); keyed on (class, text) like _match_case_cached()."""
+        for citation_type, pattern in cls._COMPILED_STATUTE.items():
+            match = pattern.search(text)
+            if match:
+                components = cls._parse_components(match.groupdict())
+                return citation_type, tuple(components.items())
+        return None, ()
+
+    def _is_format_valid(self, text: str) -> bool:
+        """
+        Format validity of `text` only, with the same outcome as verify().
+
+        Used by verify_batch(), which only needs counts: skips building the
+        message, trace and result object for every citation in the batch.
+        """
+        if self._match_case(text)[0] is not None:
+            return True
+        if self._looks_like_statute(text):
+            return self._match_statute_cached(text)[0] is not None
+        return False
+
+    @staticmethod
+    def _looks_like_statute(text: str) -> bool:
+        """Cheap substring test for routing `text` to the statute patterns."""
+        return "U.S.C." in text or "§" in text
+
+    def _batch_cache_path(self, citations: List[str]) -> str:
+        """Cache file for `citations`. The key also covers everything that
+        decides a match: the package version (matching logic), the guard class,
+        its pattern tables and its case-name requirements. Upgrading or
+        editing any of them never serves counts computed under the old ones."""
+        cls = type(self)
+        digest = hashlib.blake2b(digest_size=16)
+        matcher = (
+            __version__,
+            f"{cls.__module__}.{cls.__qualname__}",
+            cls.CASE_PATTERNS,
+            cls.STATUTE_PATTERNS,
+            sorted(cls._REQUIRES_CASE_NAME),
+        )
+        digest.update(repr(matcher).encode("utf-8"))
+        # JSON encoding keeps list boundaries unambiguous (citations may contain "\n").
+        digest.update(json.dumps(citations).encode("utf-8"))
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.json")
+
+    @staticmethod
+    def _load_batch_cache(path: str, total: int) -> Optional[BatchCitationResult]:
+        """Read a cached batch result; None if missing, unreadable or inconsistent."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            valid, invalid = data["format_valid"], data["format_invalid"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        # Never trust an entry that does not add up for this input.
+        if not (
+            data.get("total") == total
+            and isinstance(valid, int)
+            and isinstance(invalid, int)
+            and 0 <= valid <= total
+            and valid + invalid == total
+        ):
+            return None
+        return BatchCitationResult(total=total, format_valid=valid, format_invalid=invalid)
+
+    def _store_batch_cache(self, path: str, result: BatchCitationResult) -> None:
+        """Write a batch result atomically; caching failures never fail verification."""
+        payload = {
+            "total": result.total,
+            "format_valid": result.format_valid,
+            "format_invalid": result.format_invalid,
+        }
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     @staticmethod
     def _format_match_trace(citation_type: str, text: str) -> list:
         """Trace for a format-matching citation. Format match is PARSED, not authority proof."""
@@ -434,7 +713,6 @@ class CitationGuard:
         Fields coerced: volume, title, page, number, year.
         All other fields are left as-is.
         """
-        _NUMERIC_FIELDS = {"volume", "title", "page", "number", "year"}
         result = {}
         for key, value in groupdict.items():
             if value is not None and key in _NUMERIC_FIELDS:
@@ -6,7 +6,9 @@ explicitly outside this guard.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import re
+import threading
 from typing import Any, List, Optional, Tuple
 
 from z3 import BoolRef, Solver, sat, unknown, unsat
@@ -22,6 +24,64 @@ from qwed_legal.models import (
 )
 
 
+# Operative termination language (see ClauseGuard._has_operative_termination),
+# fused into one alternation so a clause is scanned once.
+_OPERATIVE_TERMINATION_RE = re.compile(
+    "|".join(
+        [
+            r"\b(?:may|can|shall|must)\s+(?:not\s+)?(?:terminate|cancel)\b",
+            r"\bneither\s+party\s+may\s+(?:terminate|cancel)\b",
+            r"\b(?:allowed|entitled)\s+to\s+(?:terminate|cancel)\b",
+            r"\bright\s+to\s+(?:terminate|cancel)\b",
+            r"\b(?:may|can|shall|must)\s+(?:not\s+)?end\s+the\s+agreement\b",
+        ]
+    )
+)
+
+
+# Keyword vocabularies for proposition extraction, built once at import.
+_PROHIBITION_WORDS = ("may not", "cannot", "neither", "shall not")
+_PERMISSION_WORDS = ("may ", "can ", "allowed")
+_TERMINATION_WORDS = ("terminate", "termination", "cancel", "end the agreement")
+
+
+# Party words recognised in clauses, one bit each. A clause's parties are the
+# OR of its bits, so "do two clauses share a party" is a single integer AND.
+_PARTY_BITS = {
+    party: 1 << bit
+    for bit, party in enumerate(
+        [
+            "seller",
+            "buyer",
+            "vendor",
+            "customer",
+            "licensee",
+            "licensor",
+            "party",
+            "parties",
+            "company",
+            "contractor",
+        ]
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def _days_pattern(context: str) -> "re.Pattern[str]":
+    """
+    Compiled day-count pattern for a context word, used with ``match()``.
+
+    The first branch finds the earliest "N days <context>" and the second the
+    earliest "<context> N days"; the second is only tried when the first has
+    no match anywhere in the text, so one call gives the same answer as two
+    separate searches tried in that order.
+    """
+    return re.compile(
+        rf"(?s:.*?)(\d+)\s*(?:calendar\s+)?(?:business\s+)?days?\s*{context}"
+        rf"|(?s:.*?){context}\s*(\d+)\s*(?:calendar\s+)?(?:business\s+)?days?"
+    )
+
+
 @dataclass
 class ClauseResult:
     """Result of clause consistency check."""
@@ -38,6 +98,22 @@ class ClauseResult:
     verification_trace: list = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class _Proposition:
+    """Heuristic facts extracted from one clause (see ClauseGuard._extract_propositions)."""
+
+    text: str
+    can_terminate: bool
+    ambiguous_termination_reference: bool
+    termination_notice_days: Optional[int]
+    min_term_days: Optional[int]
+    is_exclusive: bool
+    is_prohibition: bool
+    is_permission: bool
+    mentions_terminate: bool
+    parties: int  # bitmask over _PARTY_BITS
+
+
 class ClauseGuard:
     """
     Detect contradictory clauses in legal contracts using limited heuristics.
@@ -58,6 +134,11 @@ class ClauseGuard:
 
     def __init__(self):
         """Initialize ClauseGuard."""
+        # Reused by verify_using_z3(); each call works in its own push/pop frame.
+        # The lock keeps frames from interleaving when a guard is shared
+        # across threads.
+        self._solver = Solver()
+        self._solver_lock = threading.Lock()
 
     def check_consistency(self, clauses: List[str]) -> ClauseResult:
         """
@@ -97,12 +178,12 @@ class ClauseGuard:
         covered = sum(
             1
             for p in propositions
-            if p["can_terminate"]
-            or p["termination_notice_days"] is not None
-            or p["min_term_days"] is not None
-            or p["is_exclusive"]
+            if p.can_terminate
+            or p.termination_notice_days is not None
+            or p.min_term_days is not None
+            or p.is_exclusive
         )
-        ambiguous = [p for p in propositions if p["ambiguous_termination_reference"]]
+        ambiguous = [p for p in propositions if p.ambiguous_termination_reference]
         has_ambiguous = len(ambiguous) > 0
 
         rule_step = VerificationStep(
@@ -196,71 +277,114 @@ class ClauseGuard:
             ],
         )
 
-    def _extract_propositions(self, clauses: List[str]) -> List[dict]:
+    def _extract_propositions(self, clauses: List[str]) -> List[_Proposition]:
         """Extract supported heuristic propositions from clause text."""
         propositions = []
 
         for clause in clauses:
             lower = clause.lower()
             can_terminate = self._has_operative_termination(lower)
-            prop = {
-                "text": clause,
-                "can_terminate": can_terminate,
-                "ambiguous_termination_reference": (
-                    self._mentions_termination(lower) and not can_terminate
-                ),
-                "termination_notice_days": self._extract_days(lower, "notice"),
-                "min_term_days": self._extract_days(lower, "before"),
-                "is_exclusive": "exclusive" in lower or "only" in lower,
-                "is_prohibition": any(
-                    w in lower for w in ["may not", "cannot", "neither", "shall not"]
+            prop = _Proposition(
+                text=clause,
+                can_terminate=can_terminate,
+                ambiguous_termination_reference=(
+                    not can_terminate and self._mentions_termination(lower)
                 ),
-                "is_permission": any(w in lower for w in ["may ", "can ", "allowed"]),
-                "parties": self._extract_parties(lower),
-            }
+                termination_notice_days=self._extract_days(lower, "notice"),
+                min_term_days=self._extract_days(lower, "before"),
+                is_exclusive="exclusive" in lower or "only" in lower,
+                is_prohibition=any(w in lower for w in _PROHIBITION_WORDS),
+                is_permission=any(w in lower for w in _PERMISSION_WORDS),
+                mentions_terminate="terminate" in lower,
+                parties=self._extract_parties(lower),
+            )
             propositions.append(prop)
 
         return propositions
 
-    def _find_conflicts(self, propositions: List[dict]) -> List[Tuple[int, int, str]]:
+    def _find_conflicts(
+        self, propositions: List[_Proposition]
+    ) -> List[Tuple[int, int, str]]:
         """Find logical conflicts between clauses."""
         conflicts = []
 
-        for i, prop1 in enumerate(propositions):
-            for j, prop2 in enumerate(propositions):
-                if j <= i:
-                    continue
+        for i, j in self._candidate_pairs(propositions):
+            prop1, prop2 = propositions[i], propositions[j]
 
-                conflict = self._check_termination_conflict(prop1, prop2)
-                if conflict:
-                    conflicts.append((i, j, conflict))
-                    continue
+            conflict = self._check_termination_conflict(prop1, prop2)
+            if conflict:
+                conflicts.append((i, j, conflict))
+                continue
 
-                conflict = self._check_permission_prohibition_conflict(prop1, prop2)
-                if conflict:
-                    conflicts.append((i, j, conflict))
-                    continue
+            conflict = self._check_permission_prohibition_conflict(prop1, prop2)
+            if conflict:
+                conflicts.append((i, j, conflict))
+                continue
 
-                conflict = self._check_exclusivity_conflict(prop1, prop2)
-                if conflict:
-                    conflicts.append((i, j, conflict))
+            conflict = self._check_exclusivity_conflict(prop1, prop2)
+            if conflict:
+                conflicts.append((i, j, conflict))
 
         return conflicts
 
-    def _check_termination_conflict(self, prop1: dict, prop2: dict) -> Optional[str]:
+    @staticmethod
+    def _candidate_pairs(propositions: List[_Proposition]) -> List[Tuple[int, int]]:
+        """
+        Index pairs (i < j), in scan order, for which some conflict check can fire.
+
+        Each check needs specific proposition flags on both sides, so pairs are
+        drawn only from the clauses carrying those flags instead of from all
+        n·(n-1)/2 combinations. The checks themselves still run unchanged on
+        every candidate, so the conflicts found are exactly those of a full scan.
+        """
+        notice_rights, min_terms = [], []
+        permissions, prohibitions = [], []
+        # Inverted index: party bit -> exclusive clauses naming that party.
+        # Exclusive clauses only conflict when they share a party, so pairs
+        # come from within a bucket rather than from every exclusive clause.
+        exclusives_by_party: dict = {}
+        for idx, prop in enumerate(propositions):
+            if prop.can_terminate and prop.termination_notice_days:
+                notice_rights.append(idx)
+            if prop.min_term_days:
+                min_terms.append(idx)
+            if prop.is_permission and prop.can_terminate:
+                permissions.append(idx)
+            if prop.is_prohibition and prop.mentions_terminate:
+                prohibitions.append(idx)
+            if prop.is_exclusive and prop.parties:
+                for bit in _PARTY_BITS.values():
+                    if prop.parties & bit:
+                        exclusives_by_party.setdefault(bit, []).append(idx)
+
+        pairs = set()
+        for left, right in ((notice_rights, min_terms), (permissions, prohibitions)):
+            for a in left:
+                for b in right:
+                    if a != b:
+                        pairs.add((a, b) if a < b else (b, a))
+        for bucket in exclusives_by_party.values():
+            for pos, a in enumerate(bucket):
+                for b in bucket[pos + 1 :]:
+                    pairs.add((a, b))
+        return sorted(pairs)
+
+    def _check_termination_conflict(
+        self, prop1: _Proposition, prop2: _Proposition
+    ) -> Optional[str]:
         """Check for conflicting termination clauses."""
-        if prop1.get("can_terminate") and prop2.get("min_term_days"):
-            notice = prop1.get("termination_notice_days", 0)
-            min_term = prop2.get("min_term_days", 0)
+        if prop1.can_terminate and prop2.min_term_days:
+            notice = prop1.termination_notice_days
+            min_term = prop2.min_term_days
             if notice and min_term and notice < min_term:
                 return (
                     f"Termination notice ({notice} days) conflicts with "
                     f"minimum term ({min_term} days)"
                 )
 
-        if prop2.get("can_terminate") and prop1.get("min_term_days"):
-            notice = prop2.get("termination_notice_days", 0)
-            min_term = prop1.get("min_term_days", 0)
+        if prop2.can_terminate and prop1.min_term_days:
+            notice = prop2.termination_notice_days
+            min_term = prop1.min_term_days
             if notice and min_term and notice < min_term:
                 return (
                     f"Termination notice ({notice} days) conflicts with "
@@ -270,37 +394,37 @@ class ClauseGuard:
         return None
 
     def _check_permission_prohibition_conflict(
-        self, prop1: dict, prop2: dict
+        self, prop1: _Proposition, prop2: _Proposition
     ) -> Optional[str]:
         """Check for permission vs prohibition conflicts."""
-        if prop1.get("is_permission") and prop2.get("is_prohibition"):
-            if prop1.get("can_terminate") and "terminate" in prop2["text"].lower():
+        if prop1.is_permission and prop2.is_prohibition:
+            if prop1.can_terminate and prop2.mentions_terminate:
                 return (
                     "Permission to terminate conflicts with prohibition on termination"
                 )
 
-        if prop2.get("is_permission") and prop1.get("is_prohibition"):
-            if prop2.get("can_terminate") and "terminate" in prop1["text"].lower():
+        if prop2.is_permission and prop1.is_prohibition:
+            if prop2.can_terminate and prop1.mentions_terminate:
                 return (
                     "Permission to terminate conflicts with prohibition on termination"
                 )
 
         return None
 
-    def _check_exclusivity_conflict(self, prop1: dict, prop2: dict) -> Optional[str]:
+    def _check_exclusivity_conflict(
+        self, prop1: _Proposition, prop2: _Proposition
+    ) -> Optional[str]:
         """Check for exclusivity conflicts."""
-        if prop1.get("is_exclusive") and prop2.get("is_exclusive"):
-            parties1 = prop1.get("parties", set())
-            parties2 = prop2.get("parties", set())
-            if parties1 & parties2:
+        if prop1.is_exclusive and prop2.is_exclusive:
+            # Party bitmasks: one integer AND tests for a shared party.
+            if prop1.parties & prop2.parties:
                 return "Multiple exclusive rights granted to same party"
 
         return None
 
     def _mentions_termination(self, text: str) -> bool:
         """Return True when text contains termination-related vocabulary."""
-        terms = ["terminate", "termination", "cancel", "end the agreement"]
-        return any(t in text for t in terms)
+        return any(w in text for w in _TERMINATION_WORDS)
 
     def _has_operative_termination(self, text: str) -> bool:
         """
@@ -311,50 +435,26 @@ class ClauseGuard:
         terminate. We only extract a termination proposition when modal/legal
         language is tied directly to an operative verb such as terminate/cancel.
         """
-        operative_patterns = [
-            r"\b(?:may|can|shall|must)\s+(?:not\s+)?(?:terminate|cancel)\b",
-            r"\bneither\s+party\s+may\s+(?:terminate|cancel)\b",
-            r"\b(?:allowed|entitled)\s+to\s+(?:terminate|cancel)\b",
-            r"\bright\s+to\s+(?:terminate|cancel)\b",
-            r"\b(?:may|can|shall|must)\s+(?:not\s+)?end\s+the\s+agreement\b",
-        ]
-        return any(re.search(pattern, text) for pattern in operative_patterns)
+        return _OPERATIVE_TERMINATION_RE.search(text) is not None
 
     def _extract_days(self, text: str, context: str) -> Optional[int]:
         """Extract number of days from text near a context word."""
         if context not in text:
             return None
 
-        pattern = rf"(\d+)\s*(?:calendar\s+)?(?:business\s+)?days?\s*{context}"
-        match = re.search(pattern, text)
-        if match:
-            return int(match.group(1))
-
-        pattern = rf"{context}\s*(\d+)\s*(?:calendar\s+)?(?:business\s+)?days?"
-        match = re.search(pattern, text)
+        match = _days_pattern(context).match(text)
         if match:
-            return int(match.group(1))
+            return int(match.group(1) or match.group(2))
 
         return None
 
-    def _extract_parties(self, text: str) -> set:
-        """Extract party names from clause."""
-        parties = set()
-        for party in [
-            "seller",
-            "buyer",
-            "vendor",
-            "customer",
-            "licensee",
-            "licensor",
-            "party",
-            "parties",
-            "company",
-            "contractor",
-        ]:
+    def _extract_parties(self, text: str) -> int:
+        """Extract party names from clause, as a bitmask over _PARTY_BITS."""
+        mask = 0
+        for party, bit in _PARTY_BITS.items():
             if party in text:
-                parties.add(party)
-        return parties
+                mask |= bit
+        return mask
 
     def verify_using_z3(self, constraints: List[Any]) -> ClauseResult:
         """
@@ -415,9 +515,16 @@ class ClauseGuard:
                 ],
             )
 
-        solver = Solver()
-        solver.add(*constraints)
-        result = solver.check()
+        # Caller constraints are scoped to one frame on the reused solver and
+        # always discarded, so they never leak into the next call.
+        solver = self._solver
+        with self._solver_lock:
+            solver.push()
+            try:
+                solver.add(*constraints)
+                result = solver.check()
+            finally:
+                solver.pop()
 
         if result == sat:
             return ClauseResult(
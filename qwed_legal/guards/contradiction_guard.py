@@ -10,9 +10,11 @@ Fail-closed design:
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+import threading
 from typing import List
 
-from z3 import Int, Solver, sat, unknown
+from z3 import Bool, BoolRef, Int, Solver, sat, unknown
 
 from qwed_legal.models import (
     VerificationStep,
@@ -39,6 +41,17 @@ class Clause:
 # Categories that ContradictionGuard can translate into Z3 constraints.
 SUPPORTED_CATEGORIES = frozenset({"DURATION", "LIABILITY"})
 
+# Z3 terms shared by every guard. Expressions are immutable and belong to the
+# default context, so building them once lets all solvers reuse the same ASTs.
+_CONTRACT_DURATION_MONTHS = Int("contract_duration_months")
+_MAX_LIABILITY_USD = Int("max_liability_usd")
+
+
+@lru_cache(maxsize=None)
+def _clause_literal(index: int) -> BoolRef:
+    """Tracking literal for the index-th encoded clause of a call."""
+    return Bool(f"clause_{index}")
+
 
 class ContradictionGuard:
     """
@@ -52,8 +65,19 @@ class ContradictionGuard:
     - Supported clauses whose keywords are not modeled → partial_coverage,
       verified=False (constraint could not be encoded).
     - Z3 unknown → UNVERIFIABLE (not a false contradiction).
+
+    Each guard keeps one Z3 solver holding the base axioms; every call adds its
+    clause constraints in a push()/pop() frame on top of it, so repeated calls
+    reuse the solver instead of rebuilding it. A per-guard lock serializes those
+    frames, so one instance can be shared between threads.
     """
 
+    def __init__(self):
+        self._solver = Solver()
+        self._solver.add(_CONTRACT_DURATION_MONTHS >= 0)
+        self._solver.add(_MAX_LIABILITY_USD >= 0)
+        self._solver_lock = threading.Lock()
+
     def verify_consistency(self, clauses: List[Clause]) -> dict:
         """
         Translate supported legal clauses into Z3 constraints and check SAT.
@@ -63,6 +87,8 @@ class ContradictionGuard:
           status       (str) — consistent | contradiction | unverifiable | partial_coverage
           message      (str)
           unsupported  (list[str]) — categories not modeled by this guard
+          conflicts    (list[str]) — on contradiction only: ids (or text, when a
+                       clause has no id) of the clauses in Z3's unsat core
         """
         if not clauses:
             return self._unverifiable_result(
@@ -106,18 +132,41 @@ class ContradictionGuard:
                 ],
             )
 
-        s = Solver()
-        contract_duration_months = Int("contract_duration_months")
-        max_liability_usd = Int("max_liability_usd")
-        s.add(contract_duration_months >= 0)
-        s.add(max_liability_usd >= 0)
+        # Clause constraints live in their own frame on the shared solver and
+        # are always discarded afterwards, even if building the result fails.
+        s = self._solver
+        with self._solver_lock:
+            s.push()
+            try:
+                return self._check_supported(
+                    s, clauses, supported, unsupported, unsupported_categories
+                )
+            finally:
+                s.pop()
 
+    def _check_supported(
+        self,
+        s: Solver,
+        clauses: List[Clause],
+        supported: List[Clause],
+        unsupported: List[Clause],
+        unsupported_categories: List[str],
+    ) -> dict:
+        """Encode the supported clauses into the current solver frame and check it."""
+        contract_duration_months = _CONTRACT_DURATION_MONTHS
+        max_liability_usd = _MAX_LIABILITY_USD
         unmodeled_supported = 0
         encoded_supported = []
+        # Each constraint is asserted under its own tracking literal so that an
+        # unsat result names the responsible clauses without re-solving subsets.
+        tracked = {}
 
         duration_clauses = [c for c in supported if c.category.upper() == "DURATION"]
         for clause in duration_clauses:
-            add_result = self._add_duration_constraint(s, clause, contract_duration_months)
+            tag = self._tracking_literal(tracked, clause)
+            add_result = self._add_duration_constraint(
+                s, clause, contract_duration_months, tag
+            )
             if add_result == 0:
                 encoded_supported.append(clause)
             else:
@@ -125,7 +174,8 @@ class ContradictionGuard:
 
         liability_clauses = [c for c in supported if c.category.upper() == "LIABILITY"]
         for clause in liability_clauses:
-            add_result = self._add_liability_constraint(s, clause, max_liability_usd)
+            tag = self._tracking_literal(tracked, clause)
+            add_result = self._add_liability_constraint(s, clause, max_liability_usd, tag)
             if add_result == 0:
                 encoded_supported.append(clause)
             else:
@@ -189,10 +239,18 @@ class ContradictionGuard:
             unmodeled_supported=unmodeled_supported,
             categories_text=categories_text,
             trace=trace,
+            tracked=tracked,
         )
 
     # ── private helpers ────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _tracking_literal(tracked: dict, clause: Clause) -> BoolRef:
+        """Create the Z3 literal tracking ``clause`` and record what it names."""
+        tag = _clause_literal(len(tracked))
+        tracked[str(tag)] = clause.id or clause.text
+        return tag
+
     @staticmethod
     def _partition_clauses(clauses: List[Clause]):
         """Split clauses into supported and unsupported categories."""
@@ -203,33 +261,37 @@ class ContradictionGuard:
         return supported, unsupported
 
     @staticmethod
-    def _add_duration_constraint(s: Solver, clause: Clause, var: object) -> int:
+    def _add_duration_constraint(
+        s: Solver, clause: Clause, var: object, tag: BoolRef
+    ) -> int:
         """
-        Add a Z3 constraint for a DURATION clause.
+        Add a Z3 constraint for a DURATION clause, tracked by ``tag``.
         Returns 1 if the clause keyword is not modeled (unmodeled), 0 otherwise.
         """
         text = clause.text.lower()
         if "exactly" in text:
-            s.add(var == clause.value)
+            s.assert_and_track(var == clause.value, tag)
         elif "minimum" in text or "at least" in text:
-            s.add(var >= clause.value)
+            s.assert_and_track(var >= clause.value, tag)
         elif "maximum" in text or "up to" in text:
-            s.add(var <= clause.value)
+            s.assert_and_track(var <= clause.value, tag)
         else:
             return 1  # clause recognized as DURATION but keyword not modeled
         return 0
 
     @staticmethod
-    def _add_liability_constraint(s: Solver, clause: Clause, var: object) -> int:
+    def _add_liability_constraint(
+        s: Solver, clause: Clause, var: object, tag: BoolRef
+    ) -> int:
         """
-        Add a Z3 constraint for a LIABILITY clause.
+        Add a Z3 constraint for a LIABILITY clause, tracked by ``tag``.
         Returns 1 if the clause keyword is not modeled (unmodeled), 0 otherwise.
         """
         text = clause.text.lower()
         if "capped" in text or "max" in text or "cap" in text:
-            s.add(var <= clause.value)
+            s.assert_and_track(var <= clause.value, tag)
         elif "penalty" in text or "fixed" in text or "minimum" in text:
-            s.add(var >= clause.value)
+            s.assert_and_track(var >= clause.value, tag)
         else:
             return 1  # clause recognized as LIABILITY but keyword not modeled
         return 0
@@ -280,6 +342,7 @@ class ContradictionGuard:
         unmodeled_supported: int,
         categories_text: str,
         trace: list = None,
+        tracked: dict = None,
     ) -> dict:
         """Evaluate Z3 solver and build the final result dict."""
         has_unmodeled_supported = unmodeled_supported > 0
@@ -336,7 +399,11 @@ class ContradictionGuard:
                 ],
             }
 
-        # result == unsat → contradiction
+        # result == unsat → contradiction; the core names the clauses involved.
+        core_names = {str(literal) for literal in s.unsat_core()}
+        conflicts = [
+            name for tag, name in (tracked or {}).items() if tag in core_names
+        ]
         return {
             "verified": False,
             "status": "contradiction",
@@ -346,12 +413,13 @@ class ContradictionGuard:
                 f"duration).{coverage_note}"
             ),
             "unsupported": unsupported_categories,
+            "conflicts": conflicts,
             "verification_trace": (trace or [])
             + [
                 VerificationStep(
                     step=STEP_CONCLUSION,
                     description="Z3 evaluated: clauses are mutually contradictory.",
-                    inputs={"z3_result": "unsat"},
+                    inputs={"z3_result": "unsat", "conflicting_clauses": conflicts},
                     output="CONTRADICTION: no assignment satisfies all constraints.",
                     evidence_type=EVIDENCE_DETERMINISTIC,
                 )
@@ -4,15 +4,17 @@ DeadlineGuard: Verify date calculations in legal contracts.
 Handles business days, calendar days, leap years, and holiday exclusions.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+import threading
+from typing import Iterable, Optional, Tuple, Union
 import re
 
-from dateutil.parser import parse as parse_date
-from dateutil.relativedelta import relativedelta
 import holidays
 
+from qwed_legal.guards._dates import _add_months, _parse_date
 from qwed_legal.models import (
     VerificationStep,
     STEP_RULE_IDENTIFIED,
@@ -23,6 +25,64 @@ from qwed_legal.models import (
     EVIDENCE_UNSUPPORTED,
 )
 
+# Term parsing patterns, compiled once (word boundaries prevent false
+# positives like 'today' matching 'day').
+_NUMBER_RE = re.compile(r'\d+')
+_BUSINESS_RE = re.compile(r'\b(?:business|working|work)\b')
+_YEARS_RE = re.compile(r'\byears?\b')
+_MONTHS_RE = re.compile(r'\bmonths?\b')
+_WEEKS_RE = re.compile(r'\bweeks?\b')
+_DAYS_RE = re.compile(r'\b(?:days?|calendar\s+days?)\b')
+# Checked in this order: the first unit word found in the term wins.
+_UNIT_PATTERNS = (
+    ("years", _YEARS_RE),
+    ("months", _MONTHS_RE),
+    ("weeks", _WEEKS_RE),
+    ("days", _DAYS_RE),
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_term(term_lower: str) -> Optional[Tuple[int, str, bool]]:
+    """
+    Split a normalized term into (quantity, unit, is_business_days).
+
+    Returns None when the term has no number or no recognizable unit, so the
+    caller can fail closed. Independent of the start date, so it is shared
+    across guards and dates.
+    """
+    number = _NUMBER_RE.search(term_lower)
+    if not number:
+        return None
+    is_business_days = bool(_BUSINESS_RE.search(term_lower))
+    for unit, pattern in _UNIT_PATTERNS:
+        if pattern.search(term_lower):
+            return int(number.group()), unit, is_business_days
+    return None
+
+
+def _count_weekdays(after: date, through: date) -> int:
+    """Number of Monday-Friday dates in the interval (after, through]."""
+    days = (through - after).days
+    if days <= 0:
+        return 0
+    weeks, extra = divmod(days, 7)
+    start_weekday = after.weekday()
+    return weeks * 5 + sum(1 for i in range(1, extra + 1) if (start_weekday + i) % 7 < 5)
+
+
+def _add_weekdays(start: datetime, count: int) -> datetime:
+    """Advance `start` by `count` (> 0) Monday-Friday days, keeping the time of day."""
+    weeks, remainder = divmod(count - 1, 5)
+    current = start + timedelta(weeks=weeks)
+    remainder += 1
+    # At most five weekdays remain, so this steps over no more than one weekend.
+    while remainder:
+        current += timedelta(days=1)
+        if current.weekday() < 5:
+            remainder -= 1
+    return current
+
 
 @dataclass
 class DeadlineResult:
@@ -54,13 +114,21 @@ class DeadlineGuard:
         >>> print(result.verified)  # False - 30 business days != Feb 14
     """
     
-    def __init__(self, country: str = "US", state: Optional[str] = None):
+    def __init__(
+        self,
+        country: str = "US",
+        state: Optional[str] = None,
+        preload_years: Optional[Iterable[int]] = None,
+    ):
         """
         Initialize DeadlineGuard.
         
         Args:
             country: ISO country code for holidays (default: US)
             state: State/province code for regional holidays (optional)
+            preload_years: Years whose holidays are built up front (default:
+                the current and next year). Other years are still built
+                lazily the first time a computation reaches them.
         """
         self.country = country
         self.state = state
@@ -71,26 +139,47 @@ class DeadlineGuard:
         self.holiday_fallback_reason = None
         try:
             self.holiday_calendar = holidays.country_holidays(country, subdiv=state)
+            self._calendar_factory = partial(
+                holidays.country_holidays, country, subdiv=state
+            )
         except Exception as e:
             self.holiday_calendar = holidays.US()
+            self._calendar_factory = holidays.US
             self.holiday_calendar_valid = False
             self.holiday_fallback_reason = (
                 f"Could not build holiday calendar for country={country!r}, "
                 f"state={state!r}: {e}. Fell back to US() calendar."
             )
+        if preload_years is None:
+            this_year = date.today().year
+            preload_years = (this_year, this_year + 1)
+        # Sorted weekday holidays for bisect counting, rebuilt whenever the
+        # calendar's size changes (e.g. when another year gets populated).
+        self._holiday_index: list = []
+        self._holiday_index_size = -1
+        # Guards populating years and rebuilding the index, so a guard shared
+        # between threads never reads the calendar while it is being filled.
+        self._calendar_lock = threading.Lock()
+        self._populate_years(preload_years)
+        # Deadlines depend only on (wall-clock start, normalized term) and this
+        # instance's holiday calendar, so they are memoized per instance. The
+        # calendar's size is part of the key, so adding holidays to
+        # holiday_calendar invalidates earlier results.
+        self._deadline_cache = lru_cache(maxsize=4096)(self._compute_deadline)
     
     def verify(
         self,
-        signing_date: str,
+        signing_date: Union[str, date],
         term: str,
-        claimed_deadline: str,
+        claimed_deadline: Union[str, date],
         tolerance_days: int = 0
     ) -> DeadlineResult:
         """
         Verify a deadline calculation.
         
         Args:
-            signing_date: The date the contract was signed (ISO format or natural language)
+            signing_date: The date the contract was signed (ISO format, natural
+                language, or an already-parsed date/datetime)
             term: The term description (e.g., "30 days", "30 business days", "2 weeks")
             claimed_deadline: The deadline claimed by the LLM
             tolerance_days: Allow +/- this many days for verification (default: 0)
@@ -100,8 +189,8 @@ class DeadlineGuard:
         """
         # Parse dates
         try:
-            signing = parse_date(signing_date)
-            claimed = parse_date(claimed_deadline)
+            signing = _parse_date(signing_date)
+            claimed = _parse_date(claimed_deadline)
         except Exception as e:
             return DeadlineResult(
                 verified=False,
@@ -168,6 +257,7 @@ class DeadlineGuard:
         # could not be built, the computation may rest on the wrong calendar.
         # Do not present such a result as deterministic proof — fail closed.
         calendar_unreliable = used_business_days and not self.holiday_calendar_valid
+        computed_iso = computed.date().isoformat()
         compute_evidence = (
             EVIDENCE_UNSUPPORTED if calendar_unreliable else EVIDENCE_DETERMINISTIC
         )
@@ -185,8 +275,8 @@ class DeadlineGuard:
         else:
             message = (
                 f"❌ ERROR: Deadline mismatch. "
-                f"Expected {computed.strftime('%Y-%m-%d')}, "
-                f"but LLM claimed {claimed.strftime('%Y-%m-%d')}. "
+                f"Expected {computed_iso}, "
+                f"but LLM claimed {claimed.date().isoformat()}. "
                 f"Difference: {diff} days."
             )
 
@@ -214,7 +304,7 @@ class DeadlineGuard:
                     "used_business_days": used_business_days,
                     "holiday_calendar_valid": self.holiday_calendar_valid,
                 },
-                output=f"Computed deadline: {computed.strftime('%Y-%m-%d')}",
+                output=f"Computed deadline: {computed_iso}",
                 evidence_type=compute_evidence,
             ),
             VerificationStep(
@@ -263,74 +353,106 @@ class DeadlineGuard:
         deadline (fail-closed); used_business_days indicates whether the
         holiday calendar was relied upon.
         """
-        term_lower = term.lower().strip()
-        
-        # Extract number
-        numbers = re.findall(r'\d+', term_lower)
-        if not numbers:
-            # Fail-closed: no numeric quantity found — term is ambiguous
+        # Every step is wall-clock arithmetic, so the cache is keyed on the
+        # naive local time and the caller's tzinfo is reattached afterwards.
+        # Aware datetimes compare equal across zones for the same instant,
+        # so keying on them would hand one zone's deadline to another.
+        deadline, used_business_days = self._deadline_cache(
+            start_date.replace(tzinfo=None),
+            term.lower().strip(),
+            len(self.holiday_calendar),
+        )
+        if deadline is not None and start_date.tzinfo is not None:
+            deadline = deadline.replace(tzinfo=start_date.tzinfo)
+        return deadline, used_business_days
+
+    def _compute_deadline(
+        self, start_date: datetime, term_lower: str, calendar_size: int
+    ) -> "tuple[Optional[datetime], bool]":
+        """
+        Uncached body of _calculate_deadline() for a naive start date.
+
+        calendar_size is unused here; it only keys the cache on the state of
+        holiday_calendar.
+        """
+        parsed = _parse_term(term_lower)
+        if parsed is None:
+            # Fail-closed: no numeric quantity or no recognizable time unit
             return None, False
-        
-        num = int(numbers[0])
-        
-        # Determine unit and type (word-boundary matching to prevent
-        # false positives like 'today' matching 'day')
-        is_business_days = bool(re.search(r'\b(?:business|working|work)\b', term_lower))
-        
-        if re.search(r'\byears?\b', term_lower):
-            return start_date + relativedelta(years=num), False
-        elif re.search(r'\bmonths?\b', term_lower):
-            return start_date + relativedelta(months=num), False
-        elif re.search(r'\bweeks?\b', term_lower):
+
+        num, unit, is_business_days = parsed
+        if unit == "years":
+            return _add_months(start_date, num * 12), False
+        if unit == "months":
+            return _add_months(start_date, num), False
+        if unit == "weeks":
             if is_business_days:
                 return self._add_business_days(start_date, num * 5), True
             return start_date + timedelta(weeks=num), False
-        elif re.search(r'\b(?:days?|calendar\s+days?)\b', term_lower):
-            if is_business_days:
-                return self._add_business_days(start_date, num), True
-            return start_date + timedelta(days=num), False
-        else:
-            # Fail-closed: number found but no recognizable time unit
-            return None, False
+        if is_business_days:
+            return self._add_business_days(start_date, num), True
+        return start_date + timedelta(days=num), False
     
     def _add_business_days(self, start_date: datetime, days: int) -> datetime:
-        """Add business days to a date, excluding weekends and holidays."""
-        current = start_date
-        added = 0
-        
-        while added < days:
-            current += timedelta(days=1)
-            # Skip weekends (Saturday=5, Sunday=6)
-            if current.weekday() >= 5:
-                continue
-            # Skip holidays
-            if current in self.holiday_calendar:
-                continue
-            added += 1
+        """Add business days to a date, excluding weekends and holidays.
+
+        Same result as stepping one day at a time, but computed with weekday
+        arithmetic: jump over the weekdays, then extend by one business day
+        for each holiday that fell in the span just covered, until no new
+        holidays are found.
+        """
+        if days <= 0:
+            return start_date
+
+        current = _add_weekdays(start_date, days)
+        holidays_covered = self._count_weekday_holidays(start_date.date(), current.date())
+        while holidays_covered:
+            covered_until = current
+            current = _add_weekdays(current, holidays_covered)
+            holidays_covered = self._count_weekday_holidays(
+                covered_until.date(), current.date()
+            )
         
         return current
     
     def calculate_business_days_between(
         self,
-        start_date: str,
-        end_date: str
+        start_date: Union[str, date],
+        end_date: Union[str, date]
     ) -> int:
         """
         Calculate the number of business days between two dates.
         
         Useful for verifying claims like "response required within 10 business days."
         """
-        start = parse_date(start_date)
-        end = parse_date(end_date)
+        start = _parse_date(start_date)
+        end = _parse_date(end_date)
         
         if end < start:
             start, end = end, start
         
-        count = 0
-        current = start
-        while current < end:
-            current += timedelta(days=1)
-            if current.weekday() < 5 and current not in self.holiday_calendar:
-                count += 1
-        
-        return count
+        # Days stepped over, counting a final partial day as a whole one.
+        span = end - start
+        steps = span.days + (1 if span.seconds or span.microseconds else 0)
+        first = start.date()
+        last = first + timedelta(days=steps)
+        return _count_weekdays(first, last) - self._count_weekday_holidays(first, last)
+
+    def _populate_years(self, years: Iterable[int]) -> None:
+        """Build any of the given years missing from the holiday calendar."""
+        missing = sorted(set(years) - self.holiday_calendar.years)
+        if missing:
+            self.holiday_calendar.update(self._calendar_factory(years=missing))
+
+    def _count_weekday_holidays(self, after: date, through: date) -> int:
+        """Number of holidays falling on a weekday in the interval (after, through]."""
+        with self._calendar_lock:
+            # The index below only sees years the calendar has already built.
+            self._populate_years(range(after.year, through.year + 1))
+            if len(self.holiday_calendar) != self._holiday_index_size:
+                self._holiday_index = sorted(
+                    d for d in self.holiday_calendar if d.weekday() < 5
+                )
+                self._holiday_index_size = len(self.holiday_calendar)
+            index = self._holiday_index
+        return bisect_right(index, through) - bisect_right(index, after)
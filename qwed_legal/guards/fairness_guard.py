@@ -18,8 +18,10 @@ IMPORTANT — scope of this guard (see issue #18):
     fail closed; they are never treated as safe.
 """
 
+import asyncio
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
 from qwed_legal.models import (
     VerificationStep,
@@ -40,6 +42,19 @@ RISK_HEURISTIC_BIAS_SIGNAL = "HEURISTIC_BIAS_SIGNAL"
 RISK_LLM_GENERATION_FAILED = "LLM_GENERATION_FAILED"
 
 
+@lru_cache(maxsize=128)
+def _swap_pattern(keys: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Single-pass, case-insensitive whole-word pattern for the swap keys.
+
+    Cached per key tuple (in mapping order, which fixes alternation priority),
+    so repeated checks with the same swap mapping compile it only once.
+    """
+    return re.compile(
+        r"\b(" + "|".join(re.escape(k) for k in keys) + r")\b", re.IGNORECASE
+    )
+
+
 class FairnessGuard:
     """
     Evaluates algorithmic fairness using counterfactual testing.
@@ -64,6 +79,71 @@ class FairnessGuard:
         Fail-closed: this method never returns verified=True. A consistent
         outcome is UNVERIFIABLE_FAIRNESS (heuristic), not proof of fairness.
         """
+        early_result, counterfactual_prompt = self._prepare_counterfactual(
+            original_prompt, protected_attribute_swap
+        )
+        if early_result is not None:
+            return early_result
+
+        # 2. Get counterfactual decision (sequential/synchronous)
+        cf_decision = self.llm_client.generate(counterfactual_prompt)
+        return self._compare_decisions(
+            original_decision, cf_decision, protected_attribute_swap
+        )
+
+    async def verify_decision_fairness_async(
+        self,
+        original_prompt: str,
+        protected_attribute_swap: Dict[str, str],
+        original_decision: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of verify_decision_fairness().
+
+        When original_decision is None, the original and counterfactual prompts
+        are both sent to the LLM concurrently (asyncio.gather), so the check
+        costs one round-trip of latency instead of two. Uses the client's
+        ``agenerate`` coroutine if it has one; otherwise the synchronous
+        ``generate`` runs in the default executor. Same fail-closed semantics:
+        never returns verified=True, and a None generation fails closed.
+        """
+        early_result, counterfactual_prompt = self._prepare_counterfactual(
+            original_prompt, protected_attribute_swap
+        )
+        if early_result is not None:
+            return early_result
+
+        if original_decision is None:
+            original_decision, cf_decision = await asyncio.gather(
+                self._agenerate(original_prompt), self._agenerate(counterfactual_prompt)
+            )
+            if original_decision is None:
+                return self._generation_failed_result(protected_attribute_swap, "original")
+        else:
+            cf_decision = await self._agenerate(counterfactual_prompt)
+
+        return self._compare_decisions(
+            original_decision, cf_decision, protected_attribute_swap
+        )
+
+    async def _agenerate(self, prompt: str) -> Optional[str]:
+        """Generate with the LLM client without blocking the event loop."""
+        agenerate = getattr(self.llm_client, "agenerate", None)
+        if agenerate is not None:
+            return await agenerate(prompt)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.llm_client.generate, prompt)
+
+    def _prepare_counterfactual(
+        self, original_prompt: str, protected_attribute_swap: Dict[str, str]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Validate inputs and build the counterfactual prompt.
+
+        Returns (early_result, None) when the check must stop before any LLM
+        call, otherwise (None, counterfactual_prompt). Raises ValueError for a
+        missing client or malformed swap mapping.
+        """
         if not self.llm_client:
             raise ValueError("LLM client must be provided for counterfactual execution.")
 
@@ -86,7 +166,7 @@ class FairnessGuard:
                         evidence_type=EVIDENCE_UNSUPPORTED,
                     )
                 ],
-            }
+            }, None
 
         # Fail-closed input validation: never silently process malformed swaps.
         # 1) Keys and values must be non-null strings.
@@ -107,9 +187,7 @@ class FairnessGuard:
             )
 
         # 1. Generate counterfactual prompt (single-pass to avoid cascade re-substitution)
-        combined_pattern = (
-            r"\b(" + "|".join(re.escape(k) for k in protected_attribute_swap) + r")\b"
-        )
+        combined_pattern = _swap_pattern(tuple(protected_attribute_swap))
         lower_swap_dict = {k.lower(): v for k, v in protected_attribute_swap.items()}
 
         def match_case(match):
@@ -121,36 +199,46 @@ class FairnessGuard:
                 return rep.capitalize()
             return rep
 
-        counterfactual_prompt = re.sub(
-            combined_pattern, match_case, original_prompt, flags=re.IGNORECASE
-        )
+        counterfactual_prompt = combined_pattern.sub(match_case, original_prompt)
+        return None, counterfactual_prompt
 
-        # 2. Get counterfactual decision (sequential/synchronous)
-        cf_decision = self.llm_client.generate(counterfactual_prompt)
+    @staticmethod
+    def _generation_failed_result(
+        protected_attribute_swap: Dict[str, str], which: str
+    ) -> Dict[str, Any]:
+        """Fail-closed result when the LLM returned None for the `which` prompt."""
+        return {
+            "verified": False,
+            "risk": RISK_LLM_GENERATION_FAILED,
+            "status": STATUS_LLM_GENERATION_FAILED,
+            "message": f"The LLM client returned None for the {which} prompt.",
+            "verification_trace": [
+                VerificationStep(
+                    step=STEP_RULE_IDENTIFIED,
+                    description="Generated counterfactual prompt via attribute swap.",
+                    inputs={"protected_attribute_swap": protected_attribute_swap},
+                    output="Counterfactual prompt generated.",
+                    evidence_type=EVIDENCE_HEURISTIC,
+                ),
+                VerificationStep(
+                    step=STEP_CONCLUSION,
+                    description=f"LLM returned no {which} decision.",
+                    inputs={f"{which}_decision": None},
+                    output=f"UNSUPPORTED: {which} generation failed.",
+                    evidence_type=EVIDENCE_UNSUPPORTED,
+                ),
+            ],
+        }
 
+    def _compare_decisions(
+        self,
+        original_decision: str,
+        cf_decision: Optional[str],
+        protected_attribute_swap: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """Heuristically compare the original and counterfactual decisions."""
         if cf_decision is None:
-            return {
-                "verified": False,
-                "risk": RISK_LLM_GENERATION_FAILED,
-                "status": STATUS_LLM_GENERATION_FAILED,
-                "message": "The LLM client returned None for the counterfactual prompt.",
-                "verification_trace": [
-                    VerificationStep(
-                        step=STEP_RULE_IDENTIFIED,
-                        description="Generated counterfactual prompt via attribute swap.",
-                        inputs={"protected_attribute_swap": protected_attribute_swap},
-                        output="Counterfactual prompt generated.",
-                        evidence_type=EVIDENCE_HEURISTIC,
-                    ),
-                    VerificationStep(
-                        step=STEP_CONCLUSION,
-                        description="LLM returned no counterfactual decision.",
-                        inputs={"counterfactual_decision": None},
-                        output="UNSUPPORTED: counterfactual generation failed.",
-                        evidence_type=EVIDENCE_UNSUPPORTED,
-                    ),
-                ],
-            }
+            return self._generation_failed_result(protected_attribute_swap, "counterfactual")
 
         # 3. Heuristic equality check (strict outcome matching)
         is_consistent = (
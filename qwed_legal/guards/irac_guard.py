@@ -47,6 +47,19 @@ STATUS_COHERENCE_INVALID = "coherence_invalid"
 # be proven by regex/heuristic means. This is the normal passing state.
 STATUS_UNVERIFIABLE_REASONING = "unverifiable_reasoning"
 
+# Word tokenizer for the Rule/Application keyword-overlap check.
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Heading prefixes of all four sections in one alternation, one named group per
+# section. A single scan finds where each section's heading first appears.
+_HEADING_RE = re.compile(
+    r"(?im)^\s*(?:\*\*?)?(?:"
+    r"(?P<issue>issue|question presented|legal problem)"
+    r"|(?P<rule>rule|law|statute|legal principle)"
+    r"|(?P<application>application|analysis|reasoning|applying the law)"
+    r"|(?P<conclusion>conclusion|holding|verdict))"
+)
+
 
 @dataclass
 class IRACResult:
@@ -119,10 +132,13 @@ class IRACGuard:
     _MIN_KEYWORD_LEN = 4
     _MIN_RULE_WORDS_FOR_OVERLAP = 4
 
+    # Compiled once at class definition and shared by every instance.
+    _COMPILED_SECTIONS: Dict[str, "re.Pattern[str]"] = {
+        k: re.compile(v, re.DOTALL) for k, v in _SECTION_PATTERNS.items()
+    }
+
     def __init__(self) -> None:
-        self._compiled = {
-            k: re.compile(v, re.DOTALL) for k, v in self._SECTION_PATTERNS.items()
-        }
+        self._compiled = self._COMPILED_SECTIONS
 
     def verify_structure(self, text: str) -> dict:
         result = self.verify(text)
@@ -253,10 +269,20 @@ class IRACGuard:
 
     def _extract_sections(self, text: str) -> Tuple[Dict[str, str], List[str]]:
         """Extract IRAC section content. Returns (components, missing_sections)."""
+        # A section pattern matches exactly where its heading prefix does, so
+        # one heading scan tells which sections are missing and where each full
+        # pattern's leftmost match starts.
+        first_heading: Dict[str, int] = {}
+        for heading in _HEADING_RE.finditer(text):
+            first_heading.setdefault(heading.lastgroup, heading.start())
+            if len(first_heading) == len(self._compiled):
+                break
+
         components: Dict[str, str] = {}
         missing: List[str] = []
         for section, pattern in self._compiled.items():
-            match = pattern.search(text)
+            start = first_heading.get(section)
+            match = pattern.search(text, start) if start is not None else None
             if match:
                 components[section] = match.group(1).strip()
             else:
@@ -283,17 +309,14 @@ class IRACGuard:
 
         rule_text = components.get("rule", "")
         app_text = components.get("application", "").lower()
-        import re as _re
 
-        rule_words = _re.findall(r"\b\w+\b", rule_text.lower())
+        rule_words = _WORD_RE.findall(rule_text.lower())
         rule_keywords = [w for w in rule_words if len(w) >= self._MIN_KEYWORD_LEN]
 
         if len(rule_keywords) >= self._MIN_RULE_WORDS_FOR_OVERLAP:
-            import re as _re
-
-            app_words = set(_re.findall(r"\b\w+\b", app_text))
-            overlap = [w for w in rule_keywords if w in app_words]
-            if not overlap:
+            app_words = set(_WORD_RE.findall(app_text))
+            # Only "any shared keyword?" matters; isdisjoint() stops at the first hit.
+            if app_words.isdisjoint(rule_keywords):
                 issues.append(
                     "Application section shares no meaningful keywords with "
                     "the Rule section. The application may be structurally "
@@ -5,7 +5,8 @@ Validates choice of law, forum selection, and cross-border jurisdiction conflict
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Set
+from functools import lru_cache
+from typing import List, Optional, Dict, FrozenSet, Tuple
 from enum import Enum
 
 from qwed_legal.models import (
@@ -20,6 +21,78 @@ from qwed_legal.models import (
 )
 
 
+# Bits of the per-code kind mask built by JurisdictionGuard.__init__.
+_COMMON_LAW = 1
+_CIVIL_LAW = 2
+_US_STATE = 4
+_US_COUNTRY = 8
+
+# Recognized jurisdictions outside the legal-system and US-state tables.
+_OTHER_RECOGNIZED_JURISDICTIONS = frozenset({"EU", "UK", "ENGLAND", "SCOTLAND", "WALES"})
+_US_ONLY = frozenset({"US"})
+
+
+@lru_cache(maxsize=1024)
+def _norm(value: str) -> str:
+    """Case-fold and trim a jurisdiction or country input.
+
+    Every normalizer in this module goes through here; the same handful of
+    codes recur across verifications, so most calls are a cache hit.
+    """
+    return value.upper().strip()
+
+
+@lru_cache(maxsize=256)
+def _convention_key(convention: str) -> str:
+    """Canonical INTERNATIONAL_CONVENTIONS key ("hague choice" -> "HAGUE_CHOICE")."""
+    return convention.upper().replace(" ", "_")
+
+
+@lru_cache(maxsize=None)
+def _lookup_tables(
+    common_law: FrozenSet[str], civil_law: FrozenSet[str], us_states: FrozenSet[str]
+) -> Tuple[FrozenSet[str], Dict[str, int]]:
+    """Build (recognized codes, code -> kind bitmask) from the jurisdiction tables.
+
+    Cached on the tables themselves; the returned dict is shared and must not
+    be mutated.
+    """
+    known = frozenset().union(
+        common_law, civil_law, us_states, _OTHER_RECOGNIZED_JURISDICTIONS
+    )
+    kinds: Dict[str, int] = {"US": _US_COUNTRY}
+    for codes, bit in (
+        (common_law, _COMMON_LAW),
+        (civil_law, _CIVIL_LAW),
+        (us_states, _US_STATE),
+    ):
+        for code in codes:
+            kinds[code] = kinds.get(code, 0) | bit
+    return known, kinds
+
+
+class JurisdictionIssue(Enum):
+    """Machine-readable codes for the conflicts and warnings a check reports.
+
+    JurisdictionResult.issues lists one code per entry of conflicts and
+    warnings, so callers can aggregate results without parsing messages.
+    """
+
+    NO_PARTIES = "no_parties"
+    UNRECOGNIZED_GOVERNING_LAW = "unrecognized_governing_law"
+    UNRECOGNIZED_PARTY_COUNTRY = "unrecognized_party_country"
+    CROSS_LEGAL_SYSTEM = "cross_legal_system"
+    US_LAW_NON_US_FORUM = "us_law_non_us_forum"
+    US_FORUM_NON_US_LAW = "us_forum_non_us_law"
+    CISG_MAY_APPLY = "cisg_may_apply"
+    HOME_JURISDICTION_LAW = "home_jurisdiction_law"
+    UNRECOGNIZED_FORUM = "unrecognized_forum"
+    DIVERSITY_THRESHOLD = "diversity_threshold"
+    UNKNOWN_CONVENTION = "unknown_convention"
+    PARTIAL_CONVENTION_MEMBERSHIP = "partial_convention_membership"
+    NO_CONVENTION_MEMBERS = "no_convention_members"
+
+
 class JurisdictionType(Enum):
     """Types of jurisdiction clauses."""
 
@@ -39,6 +112,8 @@ class JurisdictionResult:
     forum: Optional[str] = None
     message: str = ""
     verification_trace: list = field(default_factory=list)
+    # One JurisdictionIssue per conflict/warning, in the order they were found.
+    issues: List[JurisdictionIssue] = field(default_factory=list)
 
 
 class JurisdictionGuard:
@@ -61,129 +136,141 @@ class JurisdictionGuard:
     """
 
     # Common law jurisdictions
-    COMMON_LAW_JURISDICTIONS: Set[str] = {
-        "US",
-        "UK",
-        "GB",
-        "CA",
-        "AU",
-        "NZ",
-        "IE",
-        "SG",
-        "HK",
-        "IN",
-    }
+    COMMON_LAW_JURISDICTIONS: FrozenSet[str] = frozenset(
+        {
+            "US",
+            "UK",
+            "GB",
+            "CA",
+            "AU",
+            "NZ",
+            "IE",
+            "SG",
+            "HK",
+            "IN",
+        }
+    )
 
     # Civil law jurisdictions
-    CIVIL_LAW_JURISDICTIONS: Set[str] = {
-        "DE",
-        "FR",
-        "IT",
-        "ES",
-        "NL",
-        "BE",
-        "AT",
-        "CH",
-        "JP",
-        "KR",
-        "BR",
-        "MX",
-    }
-
-    # US state abbreviations for forum selection
-    US_STATES: Set[str] = {
-        "AL",
-        "AK",
-        "AZ",
-        "AR",
-        "CA",
-        "CO",
-        "CT",
-        "DE",
-        "FL",
-        "GA",
-        "HI",
-        "ID",
-        "IL",
-        "IN",
-        "IA",
-        "KS",
-        "KY",
-        "LA",
-        "ME",
-        "MD",
-        "MA",
-        "MI",
-        "MN",
-        "MS",
-        "MO",
-        "MT",
-        "NE",
-        "NV",
-        "NH",
-        "NJ",
-        "NM",
-        "NY",
-        "NC",
-        "ND",
-        "OH",
-        "OK",
-        "OR",
-        "PA",
-        "RI",
-        "SC",
-        "SD",
-        "TN",
-        "TX",
-        "UT",
-        "VT",
-        "VA",
-        "WA",
-        "WV",
-        "WI",
-        "WY",
-        "DC",
-    }
-
-    # Popular corporate law states
-    CORPORATE_LAW_STATES: Set[str] = {"DE", "NV", "WY", "NY", "CA"}
-
-    # Recognized international conventions
-    INTERNATIONAL_CONVENTIONS: Dict[str, Set[str]] = {
-        "CISG": {  # UN Convention on International Sale of Goods
-            "US",
+    CIVIL_LAW_JURISDICTIONS: FrozenSet[str] = frozenset(
+        {
             "DE",
             "FR",
             "IT",
             "ES",
             "NL",
+            "BE",
             "AT",
             "CH",
-            "CN",
             "JP",
-            "AU",
-            "CA",
-        },
-        "HAGUE_CHOICE": {  # Hague Choice of Court Convention
-            "EU",
-            "UK",
-            "SG",
+            "KR",
+            "BR",
             "MX",
-            "ME",
-            "UA",
-        },
-        "NEW_YORK_CONVENTION": {  # Recognition of Arbitral Awards
-            "US",
-            "UK",
+        }
+    )
+
+    # US state abbreviations for forum selection
+    US_STATES: FrozenSet[str] = frozenset(
+        {
+            "AL",
+            "AK",
+            "AZ",
+            "AR",
+            "CA",
+            "CO",
+            "CT",
             "DE",
-            "FR",
-            "CN",
-            "JP",
+            "FL",
+            "GA",
+            "HI",
+            "ID",
+            "IL",
             "IN",
-            "AU",
-            "BR",
-            "CA",
-        },
+            "IA",
+            "KS",
+            "KY",
+            "LA",
+            "ME",
+            "MD",
+            "MA",
+            "MI",
+            "MN",
+            "MS",
+            "MO",
+            "MT",
+            "NE",
+            "NV",
+            "NH",
+            "NJ",
+            "NM",
+            "NY",
+            "NC",
+            "ND",
+            "OH",
+            "OK",
+            "OR",
+            "PA",
+            "RI",
+            "SC",
+            "SD",
+            "TN",
+            "TX",
+            "UT",
+            "VT",
+            "VA",
+            "WA",
+            "WV",
+            "WI",
+            "WY",
+            "DC",
+        }
+    )
+
+    # Popular corporate law states
+    CORPORATE_LAW_STATES: FrozenSet[str] = frozenset({"DE", "NV", "WY", "NY", "CA"})
+
+    # Recognized international conventions
+    INTERNATIONAL_CONVENTIONS: Dict[str, FrozenSet[str]] = {
+        "CISG": frozenset(  # UN Convention on International Sale of Goods
+            {
+                "US",
+                "DE",
+                "FR",
+                "IT",
+                "ES",
+                "NL",
+                "AT",
+                "CH",
+                "CN",
+                "JP",
+                "AU",
+                "CA",
+            }
+        ),
+        "HAGUE_CHOICE": frozenset(  # Hague Choice of Court Convention
+            {
+                "EU",
+                "UK",
+                "SG",
+                "MX",
+                "ME",
+                "UA",
+            }
+        ),
+        "NEW_YORK_CONVENTION": frozenset(  # Recognition of Arbitral Awards
+            {
+                "US",
+                "UK",
+                "DE",
+                "FR",
+                "CN",
+                "JP",
+                "IN",
+                "AU",
+                "BR",
+                "CA",
+            }
+        ),
     }
 
     # US State full names to abbreviations mapping
@@ -252,11 +339,21 @@ class JurisdictionGuard:
 
     def __init__(self):
         """Initialize JurisdictionGuard."""
-        pass
+        # Derived lookup tables, built from the (possibly subclass-overridden)
+        # class tables so each code's classification is a single dict probe.
+        # They depend only on the tables' contents, so guards share them.
+        self._known_jurisdictions, self._jurisdiction_kind = _lookup_tables(
+            frozenset(self.COMMON_LAW_JURISDICTIONS),
+            frozenset(self.CIVIL_LAW_JURISDICTIONS),
+            frozenset(self.US_STATES),
+        )
+        # Membership depends only on (convention, parties) and this instance's
+        # tables, so it is memoized per instance; results are immutable tuples.
+        self._membership_cache = lru_cache(maxsize=4096)(self._convention_membership)
 
     def _normalize_jurisdiction(self, jurisdiction: str) -> str:
         """Normalize jurisdiction to standard form (abbreviation for US states)."""
-        upper = jurisdiction.upper().strip()
+        upper = _norm(jurisdiction)
         # If it's a full state name, convert to abbreviation
         if upper in self.US_STATE_NAMES:
             return self.US_STATE_NAMES[upper]
@@ -271,7 +368,7 @@ class JurisdictionGuard:
         country codes such as DE/IN into US states. Full US state names are
         treated as US to avoid misclassifying domestic contracts as foreign.
         """
-        upper = country.upper().strip()
+        upper = _norm(country)
         if upper in self.COUNTRY_NAMES:
             return self.COUNTRY_NAMES[upper]
         if upper in self.US_STATE_NAMES:
@@ -289,7 +386,7 @@ class JurisdictionGuard:
         if not jurisdiction or not normalized:
             return False
 
-        upper = jurisdiction.upper().strip()
+        upper = _norm(jurisdiction)
         # Only full country names are unambiguous here. Raw two-letter values
         # such as "DE" may mean either Germany or Delaware depending on context,
         # so keep those eligible for US-state checks in governing-law/forum logic.
@@ -318,6 +415,7 @@ class JurisdictionGuard:
         """
         conflicts = []
         warnings = []
+        issues = []
         selected_forum = forum if forum is not None else forum_selection
 
         # Fail-closed: jurisdiction consistency cannot be verified without party
@@ -327,6 +425,7 @@ class JurisdictionGuard:
             return JurisdictionResult(
                 verified=False,
                 conflicts=["No parties provided."],
+                issues=[JurisdictionIssue.NO_PARTIES],
                 governing_law=governing_law,
                 forum=selected_forum,
                 message=(
@@ -356,16 +455,19 @@ class JurisdictionGuard:
             conflicts.append(
                 f"Unrecognized governing law jurisdiction: '{governing_law}'"
             )
+            issues.append(JurisdictionIssue.UNRECOGNIZED_GOVERNING_LAW)
 
         # Check 2: Cross-border legal system conflicts
         # Unknown party country codes are not silently skipped —
         # they are flagged so downstream consumers know coverage is partial.
         party_legal_systems = set()
         unknown_party_countries = []
+        kind_of = self._jurisdiction_kind.get
         for country in parties_upper:
-            if country in self.COMMON_LAW_JURISDICTIONS:
+            kind = kind_of(country, 0)
+            if kind & _COMMON_LAW:
                 party_legal_systems.add("COMMON_LAW")
-            elif country in self.CIVIL_LAW_JURISDICTIONS:
+            elif kind & _CIVIL_LAW:
                 party_legal_systems.add("CIVIL_LAW")
             else:
                 unknown_party_countries.append(country)
@@ -376,28 +478,37 @@ class JurisdictionGuard:
                 f"Legal system classification (Common Law / Civil Law) is incomplete. "
                 f"Cross-border conflict analysis may be inaccurate."
             )
+            issues.append(JurisdictionIssue.UNRECOGNIZED_PARTY_COUNTRY)
 
         if len(party_legal_systems) > 1:
             warnings.append(
                 "Cross-border contract with parties from different legal systems "
                 "(Common Law and Civil Law). Consider CISG applicability."
             )
+            issues.append(JurisdictionIssue.CROSS_LEGAL_SYSTEM)
+
+        # Shared by checks 3 and 5: a full non-US country name (e.g. "Germany")
+        # is never a US state even when its code collides with one (DE).
+        governing_law_is_non_us_country = self._is_non_us_country_reference(
+            governing_law, governing_law_upper
+        )
+        governing_law_is_us_jurisdiction = self._is_us_jurisdiction(governing_law_upper)
 
         # Check 3: Forum vs governing law mismatch
+        # (an empty governing law is already reported by check 1)
         if forum_upper and governing_law_upper:
-            governing_law_is_us_state = self._is_us_state(
-                governing_law_upper
-            ) and not self._is_non_us_country_reference(
-                governing_law, governing_law_upper
+            governing_law_is_us_state = (
+                self._is_us_state(governing_law_upper)
+                and not governing_law_is_non_us_country
+            )
+            forum_is_non_us_country = self._is_non_us_country_reference(
+                selected_forum, forum_upper
             )
-            forum_is_us_state = self._is_us_state(
-                forum_upper
-            ) and not self._is_non_us_country_reference(selected_forum, forum_upper)
-            forum_is_us_jurisdiction = self._is_us_jurisdiction(
-                forum_upper
-            ) and not self._is_non_us_country_reference(selected_forum, forum_upper)
-            governing_law_is_non_us_country = self._is_non_us_country_reference(
-                governing_law, governing_law_upper
+            forum_is_us_state = (
+                self._is_us_state(forum_upper) and not forum_is_non_us_country
+            )
+            forum_is_us_jurisdiction = (
+                self._is_us_jurisdiction(forum_upper) and not forum_is_non_us_country
             )
 
             if governing_law_is_us_state and not forum_is_us_jurisdiction:
@@ -405,17 +516,15 @@ class JurisdictionGuard:
                     f"Governing law '{governing_law}' (US state) but forum '{selected_forum}' is non-US. "
                     "This may create enforcement issues."
                 )
+                issues.append(JurisdictionIssue.US_LAW_NON_US_FORUM)
             elif forum_is_us_state and (
-                governing_law_is_non_us_country
-                or not (
-                    self._is_us_jurisdiction(governing_law_upper)
-                    or governing_law_upper in ["US", "NY", "CA", "DE"]
-                )
+                governing_law_is_non_us_country or not governing_law_is_us_jurisdiction
             ):
                 conflicts.append(
                     f"Forum '{selected_forum}' (US state) but governing law '{governing_law}' is non-US. "
                     "Consider alignment for enforceability."
                 )
+                issues.append(JurisdictionIssue.US_FORUM_NON_US_LAW)
 
         # Check 4: CISG applicability warning
         # `parties_countries` is country-level input. Do not infer US parties from
@@ -424,7 +533,7 @@ class JurisdictionGuard:
         party_country_set = set(parties_upper)
         cross_border_parties = len(party_country_set) > 1
         us_party = "US" in party_country_set
-        foreign_party = any(c != "US" for c in party_country_set)
+        foreign_party = not party_country_set.issubset(_US_ONLY)
         sale_of_goods = contract_type and contract_type.lower().strip() in {
             "sale_of_goods",
             "sale of goods",
@@ -434,28 +543,28 @@ class JurisdictionGuard:
             warnings.append(
                 "International sale of goods may be subject to CISG unless expressly excluded."
             )
+            issues.append(JurisdictionIssue.CISG_MAY_APPLY)
 
         # Check 5: Neutral jurisdiction suggestion
         # Compare governing law to party countries using country-level semantics.
         # US state laws (e.g., Delaware -> DE) should match US parties, not
         # foreign party country codes that collide with state abbreviations
         # (e.g., Germany -> DE, India -> IN).
-        governing_law_is_us_party_jurisdiction = self._is_us_jurisdiction(
-            governing_law_upper
-        ) and not self._is_non_us_country_reference(
-            governing_law, governing_law_upper
+        governing_law_is_us_party_jurisdiction = (
+            governing_law_is_us_jurisdiction and not governing_law_is_non_us_country
         )
         governing_law_matches_party_country = (
-            governing_law_is_us_party_jurisdiction and "US" in parties_upper
+            governing_law_is_us_party_jurisdiction and us_party
         ) or (
             not governing_law_is_us_party_jurisdiction
-            and governing_law_upper in parties_upper
+            and governing_law_upper in party_country_set
         )
         if cross_border_parties and governing_law_matches_party_country:
             warnings.append(
                 f"Governing law '{governing_law}' favors one party's home jurisdiction. "
                 "Consider a neutral jurisdiction for balance."
             )
+            issues.append(JurisdictionIssue.HOME_JURISDICTION_LAW)
 
         verified = len(conflicts) == 0 and len(warnings) == 0
 
@@ -522,6 +631,7 @@ class JurisdictionGuard:
             forum=selected_forum,
             message=message,
             verification_trace=trace,
+            issues=issues,
         )
 
     def verify_forum_selection(
@@ -542,19 +652,22 @@ class JurisdictionGuard:
         """
         conflicts = []
         warnings = []
+        issues = []
         forum_upper = self._normalize_jurisdiction(forum)
 
         # Validate forum
         if not self._is_valid_jurisdiction(forum_upper):
             conflicts.append(f"Unrecognized forum: '{forum}'")
+            issues.append(JurisdictionIssue.UNRECOGNIZED_FORUM)
 
         # Check for common federal court thresholds
-        if contract_value and forum_upper in self.US_STATES:
+        if contract_value and self._is_us_state(forum_upper):
             if contract_value < 75000:
                 warnings.append(
                     f"Contract value ${contract_value:,.0f} may not meet diversity "
                     "jurisdiction threshold ($75,000) for US federal court."
                 )
+                issues.append(JurisdictionIssue.DIVERSITY_THRESHOLD)
 
         # Fail-closed and consistent with verify_choice_of_law: warnings (e.g.
         # an unresolved diversity-jurisdiction threshold) are ambiguities that
@@ -610,6 +723,7 @@ class JurisdictionGuard:
             forum=forum,
             message=message,
             verification_trace=trace,
+            issues=issues,
         )
 
     def check_convention_applicability(
@@ -625,8 +739,8 @@ class JurisdictionGuard:
         Returns:
             JurisdictionResult with applicability status
         """
-        convention_upper = convention.upper().replace(" ", "_")
-        parties_upper = [p.upper().strip() for p in parties_countries]
+        convention_upper = _convention_key(convention)
+        parties_upper = list(map(_norm, parties_countries))
 
         # Fail-closed: with no parties, all([]) would be True and falsely report
         # the convention as applicable. An empty party list cannot be verified.
@@ -634,6 +748,7 @@ class JurisdictionGuard:
             return JurisdictionResult(
                 verified=False,
                 conflicts=["No parties provided."],
+                issues=[JurisdictionIssue.NO_PARTIES],
                 message=(
                     f"❌ UNVERIFIABLE: Cannot determine {convention} applicability "
                     "with no parties specified."
@@ -653,6 +768,7 @@ class JurisdictionGuard:
             return JurisdictionResult(
                 verified=False,
                 conflicts=[f"Unknown convention: '{convention}'"],
+                issues=[JurisdictionIssue.UNKNOWN_CONVENTION],
                 message=f"❌ Unknown convention: '{convention}'",
                 verification_trace=[
                     VerificationStep(
@@ -665,9 +781,9 @@ class JurisdictionGuard:
                 ],
             )
 
-        member_countries = self.INTERNATIONAL_CONVENTIONS[convention_upper]
-        all_members = all(c in member_countries for c in parties_upper)
-        some_members = any(c in member_countries for c in parties_upper)
+        all_members, some_members, non_members = self._membership_cache(
+            convention_upper, tuple(parties_upper)
+        )
 
         rule_step = VerificationStep(
             step=STEP_RULE_IDENTIFIED,
@@ -694,10 +810,11 @@ class JurisdictionGuard:
                 ],
             )
         elif some_members:
-            non_members = [c for c in parties_upper if c not in member_countries]
+            non_members = list(non_members)
             return JurisdictionResult(
                 verified=False,
                 warnings=[f"Not all parties are {convention} members: {non_members}"],
+                issues=[JurisdictionIssue.PARTIAL_CONVENTION_MEMBERSHIP],
                 message=f"⚠️ {convention} may not apply to all parties.",
                 verification_trace=[
                     rule_step,
@@ -721,6 +838,7 @@ class JurisdictionGuard:
             return JurisdictionResult(
                 verified=False,
                 conflicts=[f"No parties are {convention} member states."],
+                issues=[JurisdictionIssue.NO_CONVENTION_MEMBERS],
                 message=f"❌ {convention} does not apply.",
                 verification_trace=[
                     rule_step,
@@ -734,19 +852,32 @@ class JurisdictionGuard:
                 ],
             )
 
+    def _convention_membership(
+        self, convention_upper: str, parties: Tuple[str, ...]
+    ) -> Tuple[bool, bool, Tuple[str, ...]]:
+        """Return (all_members, some_members, non_members) for a known convention."""
+        member_countries = self.INTERNATIONAL_CONVENTIONS[convention_upper]
+        party_set = frozenset(parties)
+        all_members = party_set.issubset(member_countries)
+        some_members = not party_set.isdisjoint(member_countries)
+        # Only partial membership reports non-members; keep input order.
+        non_members = (
+            tuple(c for c in parties if c not in member_countries)
+            if some_members and not all_members
+            else ()
+        )
+        return all_members, some_members, non_members
+
     def _is_valid_jurisdiction(self, jurisdiction: str) -> bool:
         """Check if a jurisdiction is recognized."""
-        return (
-            jurisdiction in self.COMMON_LAW_JURISDICTIONS
-            or jurisdiction in self.CIVIL_LAW_JURISDICTIONS
-            or jurisdiction in self.US_STATES
-            or jurisdiction in {"EU", "UK", "ENGLAND", "SCOTLAND", "WALES"}
-        )
+        return jurisdiction in self._known_jurisdictions
 
     def _is_us_state(self, jurisdiction: str) -> bool:
         """Check if jurisdiction is a US state."""
-        return jurisdiction in self.US_STATES
+        return bool(self._jurisdiction_kind.get(jurisdiction, 0) & _US_STATE)
 
     def _is_us_jurisdiction(self, jurisdiction: str) -> bool:
         """Check if jurisdiction is US-related."""
-        return jurisdiction in self.US_STATES or jurisdiction == "US"
+        return bool(
+            self._jurisdiction_kind.get(jurisdiction, 0) & (_US_STATE | _US_COUNTRY)
+        )
@@ -17,6 +17,28 @@ from qwed_legal.models import (
 )
 
 
+# Decimal constants shared by every calculation (built once, not per call).
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_CENTS = Decimal("0.01")
+
+
+def _to_decimal(value) -> Decimal:
+    """
+    Convert an input amount to Decimal exactly as ``Decimal(str(value))`` would.
+
+    Plain ints and Decimals skip the string round-trip (both are already
+    exact); floats and anything else still go through ``str`` so binary-float
+    noise never leaks into the result.
+    """
+    value_type = type(value)
+    if value_type is int:
+        return Decimal(value)
+    if value_type is Decimal:
+        return value
+    return Decimal(str(value))
+
+
 @dataclass
 class LiabilityResult:
     """Result of liability verification."""
@@ -66,7 +88,7 @@ class LiabilityGuard:
                 used as a success criterion because approximate caps are not
                 legal proof.
         """
-        self.tolerance = Decimal(str(tolerance_percent)) / Decimal("100")
+        self.tolerance = _to_decimal(tolerance_percent) / _HUNDRED
     
     def verify_cap(
         self,
@@ -97,14 +119,14 @@ class LiabilityGuard:
                 stacklevel=2,
             )
 
-        cv = Decimal(str(contract_value))
-        pct = Decimal(str(cap_percentage)) / Decimal("100")
-        claimed = Decimal(str(claimed_cap))
+        cv = _to_decimal(contract_value)
+        pct = _to_decimal(cap_percentage) / _HUNDRED
+        claimed = _to_decimal(claimed_cap)
         
-        computed = (cv * pct).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        computed = (cv * pct).quantize(_CENTS, rounding=ROUND_HALF_UP)
         difference = abs(computed - claimed)
         
-        verified = difference == Decimal("0")
+        verified = difference == _ZERO
         
         if verified:
             message = f"✅ VERIFIED: Liability cap of ${claimed:,.2f} is correct."
@@ -120,7 +142,7 @@ class LiabilityGuard:
         return LiabilityResult(
             verified=verified,
             contract_value=cv,
-            cap_percentage=Decimal(str(cap_percentage)),
+            cap_percentage=_to_decimal(cap_percentage),
             claimed_cap=claimed,
             computed_cap=computed,
             difference=difference,
@@ -162,23 +184,25 @@ class LiabilityGuard:
         Returns:
             TieredLiabilityResult with verification status
         """
-        total_computed = Decimal("0")
+        total_computed = _ZERO
         computed_tiers = []
+        # Locals for the per-tier loop.
+        hundred, cents, rounding = _HUNDRED, _CENTS, ROUND_HALF_UP
         
         for tier in tiers:
-            base = Decimal(str(tier["base"]))
-            pct = Decimal(str(tier["percentage"])) / Decimal("100")
-            tier_liability = (base * pct).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            base = _to_decimal(tier["base"])
+            pct = _to_decimal(tier["percentage"]) / hundred
+            tier_liability = (base * pct).quantize(cents, rounding=rounding)
             total_computed += tier_liability
             computed_tiers.append({
                 **tier,
                 "computed_liability": float(tier_liability)
             })
         
-        claimed = Decimal(str(claimed_total))
+        claimed = _to_decimal(claimed_total)
         difference = abs(total_computed - claimed)
         
-        verified = difference == Decimal("0")
+        verified = difference == _ZERO
         
         if verified:
             message = f"✅ VERIFIED: Total tiered liability of ${claimed:,.2f} is correct."
@@ -237,14 +261,14 @@ class LiabilityGuard:
         Returns:
             LiabilityResult with verification status
         """
-        fee = Decimal(str(annual_fee))
-        mult = Decimal(str(multiplier))
-        claimed = Decimal(str(claimed_limit))
+        fee = _to_decimal(annual_fee)
+        mult = _to_decimal(multiplier)
+        claimed = _to_decimal(claimed_limit)
         
-        computed = (fee * mult).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        computed = (fee * mult).quantize(_CENTS, rounding=ROUND_HALF_UP)
         difference = abs(computed - claimed)
         
-        verified = difference == Decimal("0")
+        verified = difference == _ZERO
         
         if verified:
             message = f"✅ VERIFIED: Indemnity limit of ${claimed:,.2f} is correct."
@@ -259,7 +283,7 @@ class LiabilityGuard:
         return LiabilityResult(
             verified=verified,
             contract_value=fee,
-            cap_percentage=mult * Decimal("100"),
+            cap_percentage=mult * _HUNDRED,
             claimed_cap=claimed,
             computed_cap=computed,
             difference=difference,
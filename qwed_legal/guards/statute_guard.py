@@ -6,12 +6,11 @@ Validates claim periods by jurisdiction and claim type.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict
 from enum import Enum
 
-from dateutil.parser import parse as parse_date
-from dateutil.relativedelta import relativedelta
-
+from qwed_legal.guards._dates import _add_months, _parse_date
 from qwed_legal.models import (
     VerificationStep,
     STEP_RULE_IDENTIFIED,
@@ -23,6 +22,18 @@ from qwed_legal.models import (
 )
 
 
+@lru_cache(maxsize=256)
+def _claim_type_key(claim_type: str) -> str:
+    """Normalize a claim type to its LIMITATIONS key form, e.g. "breach_of_contract"."""
+    return claim_type.lower().replace(" ", "_")
+
+
+@lru_cache(maxsize=256)
+def _jurisdiction_key(jurisdiction: str) -> str:
+    """Normalize a jurisdiction to its LIMITATIONS key form (exact match only)."""
+    return jurisdiction.upper().strip()
+
+
 class ClaimType(Enum):
     """Types of legal claims with different limitation periods."""
 
@@ -38,7 +49,7 @@ class ClaimType(Enum):
     DEFAMATION = "defamation"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StatuteResult:
     """Result of statute of limitations verification."""
 
@@ -270,8 +281,8 @@ class StatuteOfLimitationsGuard:
         """
         # Parse dates
         try:
-            incident = parse_date(incident_date)
-            filing = parse_date(filing_date)
+            incident = _parse_date(incident_date)
+            filing = _parse_date(filing_date)
         except Exception as e:
             return StatuteResult(
                 verified=False,
@@ -300,8 +311,8 @@ class StatuteOfLimitationsGuard:
             )
 
         # Get limitation period
-        claim_type_lower = claim_type.lower().replace(" ", "_")
-        jurisdiction_upper = jurisdiction.upper().strip()
+        claim_type_lower = _claim_type_key(claim_type)
+        jurisdiction_upper = _jurisdiction_key(jurisdiction)
 
         # Fail-closed: exact jurisdiction match only (no partial matching)
         if jurisdiction_upper not in self.LIMITATIONS:
@@ -371,11 +382,12 @@ class StatuteOfLimitationsGuard:
         period_years = limits[claim_type_lower]
 
         # Calculate expiration date
-        expiration = incident + relativedelta(years=int(period_years))
+        expiration = _add_months(incident, int(period_years) * 12)
         if period_years % 1 != 0:
-            # Handle fractional years (e.g., 2.5 years)
+            # Handle fractional years (e.g., 2.5 years). The remainder is added
+            # as a second step so the day is clamped after the whole years.
             extra_months = int((period_years % 1) * 12)
-            expiration = expiration + relativedelta(months=extra_months)
+            expiration = _add_months(expiration, extra_months)
 
         # Calculate days remaining
         days_remaining = (expiration - filing).days
@@ -387,14 +399,15 @@ class StatuteOfLimitationsGuard:
         else:
             verified = within_period
 
+        expiration_iso = expiration.date().isoformat()
         if within_period:
             message = (
                 f"✅ WITHIN STATUTE: Claim can be filed. "
-                f"{days_remaining} days remaining until expiration on {expiration.strftime('%Y-%m-%d')}."
+                f"{days_remaining} days remaining until expiration on {expiration_iso}."
             )
         else:
             message = (
-                f"❌ EXPIRED: Statute of limitations expired on {expiration.strftime('%Y-%m-%d')}. "
+                f"❌ EXPIRED: Statute of limitations expired on {expiration_iso}. "
                 f"Filing date is {abs(days_remaining)} days past expiration."
             )
 
@@ -416,7 +429,7 @@ class StatuteOfLimitationsGuard:
                     "accrual_date": str(incident),
                     "limitation_period_years": period_years,
                 },
-                output=f"Expiration date: {expiration.strftime('%Y-%m-%d')}",
+                output=f"Expiration date: {expiration_iso}",
                 evidence_type=EVIDENCE_DETERMINISTIC,
             ),
             VerificationStep(
@@ -488,17 +501,8 @@ class StatuteOfLimitationsGuard:
         Returns:
             Limitation period in years, or None if jurisdiction/claim unknown
         """
-        claim_type_lower = claim_type.lower().replace(" ", "_")
-        jurisdiction_upper = jurisdiction.upper().strip()
-
-        if jurisdiction_upper not in self.LIMITATIONS:
-            return None
-
-        limits = self.LIMITATIONS[jurisdiction_upper]
-        if claim_type_lower not in limits:
-            return None
-
-        return limits[claim_type_lower]
+        limits = self.LIMITATIONS.get(_jurisdiction_key(jurisdiction))
+        return limits.get(_claim_type_key(claim_type)) if limits else None
 
     def compare_jurisdictions(
         self, claim_type: str, jurisdictions: list
@@ -513,4 +517,10 @@ class StatuteOfLimitationsGuard:
         Returns:
             Dict mapping jurisdiction to limitation period (None if unknown)
         """
-        return {j: self.get_limitation_period(claim_type, j) for j in jurisdictions}
+        claim_type_lower = _claim_type_key(claim_type)
+        limitations = self.LIMITATIONS
+        comparison: Dict[str, Optional[float]] = {}
+        for jurisdiction in jurisdictions:
+            limits = limitations.get(_jurisdiction_key(jurisdiction))
+            comparison[jurisdiction] = limits.get(claim_type_lower) if limits else None
+        return comparison
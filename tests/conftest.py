@@ -0,0 +1,21 @@
+"""Shared fixtures for QWED-Legal tests."""
+
+import pytest
+
+from qwed_legal import DeadlineGuard, LiabilityGuard
+
+
+@pytest.fixture(scope="session")
+def deadline_guard():
+    """One default DeadlineGuard shared by stateless deadline tests.
+
+    Building the holiday calendar dominates DeadlineGuard() construction.
+    Tests that inspect the per-guard deadline cache build their own guard.
+    """
+    return DeadlineGuard()
+
+
+@pytest.fixture(scope="session")
+def liability_guard():
+    """One default LiabilityGuard shared by stateless liability tests."""
+    return LiabilityGuard()
@@ -11,6 +11,10 @@ Key invariants:
 - check_statute_citation() same semantics
 """
 
+import dataclasses
+
+import pytest
+
 from qwed_legal.guards.citation_guard import (
     CitationGuard,
     STATUS_FORMAT_INVALID,
@@ -211,6 +215,39 @@ class TestBatchCitationResult:
         assert result.format_valid == 1
         assert result.format_invalid == 1
 
+    def test_batch_counts_match_per_citation_verify(self):
+        """Batch counting must agree with verify() on every result kind."""
+        citations = [
+            "Brown v. Board, 347 U.S. 483 (1954)",  # case reporter
+            "[2020] UKSC 5",  # neutral citation, no case name
+            "42 U.S.C. § 1983",  # statute
+            "347 U.S. 483 and 42 U.S.C. § 1983",  # bare case fragment + statute
+            "123 U.S. 456 (1990)",  # missing case name
+            "Fake v. Case, 999 X.Y.Z. 123 (2020)",  # unknown reporter
+            "no citation here",
+        ]
+        expected = sum(self.guard.verify(c).format_valid for c in citations)
+        result = self.guard.verify_batch(citations)
+        assert result.format_valid == expected == 4
+        assert result.format_invalid == len(citations) - expected
+
+    def test_batch_counts_repeated_citations(self):
+        """Each occurrence of a repeated citation is counted."""
+        citations = ["Brown v. Board, 347 U.S. 483 (1954)"] * 3 + ["Fake v. X, 999 XYZ 1"] * 2
+        result = self.guard.verify_batch(citations)
+        assert result.total == 5
+        assert result.format_valid == 3
+        assert result.format_invalid == 2
+
+    def test_batch_workers_match_serial_counts(self):
+        """Multi-process counting agrees with the in-process path."""
+        citations = [f"Case{i} v. Other, {i % 900 + 1} U.S. 1" for i in range(600)]
+        citations += [f"Fake{i} v. X, {i} XYZ 1" for i in range(100)]
+        serial = self.guard.verify_batch(citations)
+        parallel = self.guard.verify_batch(citations, workers=2)
+        assert parallel == serial
+        assert (serial.format_valid, serial.format_invalid) == (600, 100)
+
     def test_batch_valid_alias(self):
         """Backward-compat: result.valid == result.format_valid."""
         citations = ["Brown v. Board, 347 U.S. 483 (1954)", "Fake v. X, 999 XYZ 1"]
@@ -421,6 +458,12 @@ class TestCaseNamePositionCheck:
         )
         assert result.format_valid is True
 
+    def test_uppercase_v_dot_case_name_accepted(self):
+        """The cheap "v." pre-check must not reject an upper-case "V." separator."""
+        result = self.guard.verify("Brown V. Board, 347 U.S. 483 (1954)")
+        assert result.format_valid is True
+        assert result.citation_type == "US_SCOTUS"
+
     def test_federal_reporter_name_after_reporter_invalid(self):
         """Same positional check applies to F.3d reporter."""
         result = self.guard.verify("123 F.3d 456 Fake v. Case")
@@ -456,3 +499,121 @@ class TestMixedCitationStatuteFallback:
         assert result.format_valid is False
         assert result.status == STATUS_FORMAT_INVALID
         assert any("case name" in issue.lower() for issue in result.issues)
+
+
+class TestCitationResultImmutability:
+    """Results are frozen: a verdict cannot be flipped after verify() returns."""
+
+    def test_citation_result_is_frozen(self):
+        result = CitationGuard().verify("Fake v. Case, 999 X.Y.Z. 123 (2020)")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.format_valid = True
+
+    def test_batch_result_is_frozen(self):
+        result = CitationGuard().verify_batch(["Brown v. Board, 347 U.S. 483 (1954)"])
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.format_valid = 0
+
+
+class TestCitationMatchCache:
+    """Repeated citations reuse the cached match without sharing mutable results."""
+
+    def setup_method(self):
+        CitationGuard.clear_cache()
+        self.guard = CitationGuard()
+
+    def test_repeated_citation_hits_cache(self):
+        citation = "Brown v. Board, 347 U.S. 483 (1954)"
+        first = self.guard.verify(citation)
+        second = CitationGuard().verify(citation)
+        assert first.parsed_components == second.parsed_components
+        assert CitationGuard.cache_info().hits >= 1
+
+    def test_cached_results_are_independent(self):
+        """Mutating one result must not leak into later results for the same text."""
+        citation = "Brown v. Board, 347 U.S. 483 (1954)"
+        first = self.guard.verify(citation)
+        first.parsed_components["volume"] = 0
+        first.issues.append("tampered")
+        second = self.guard.verify(citation)
+        assert second.parsed_components["volume"] == 347
+        assert second.issues == []
+
+    def test_statute_results_are_independent(self):
+        """Statute matches are memoized too, with a fresh components dict per result."""
+        citation = "42 U.S.C. § 1983"
+        first = self.guard.check_statute_citation(citation)
+        first.parsed_components["title"] = 0
+        second = self.guard.check_statute_citation(citation)
+        assert second.parsed_components == CitationGuard().check_statute_citation(
+            citation
+        ).parsed_components
+        assert second.parsed_components["title"] != 0
+        assert CitationGuard._match_statute_cached.cache_info().hits >= 2
+
+    def test_clear_cache_resets_stats(self):
+        self.guard.verify("[2020] UKSC 5")
+        CitationGuard.clear_cache()
+        assert CitationGuard.cache_info().currsize == 0
+
+    def test_subclass_patterns_are_honored(self):
+        """A subclass with its own reporter table matches against that table."""
+
+        class WithSupremeCourtReporter(CitationGuard):
+            CASE_PATTERNS = {
+                **CitationGuard.CASE_PATTERNS,
+                "US_SCT": r"(?P<volume>\d{1,4})\s+(?P<reporter>S\.\s?Ct\.)\s+(?P<page>\d{1,5})",
+            }
+
+        citation = "Obergefell v. Hodges, 135 S. Ct. 2584 (2015)"
+        assert self.guard.verify(citation).format_valid is False
+        result = WithSupremeCourtReporter().verify(citation)
+        assert result.format_valid is True
+        assert result.citation_type == "US_SCT"
+        # The base class cache entry is untouched by the subclass match.
+        assert self.guard.verify(citation).format_valid is False
+
+
+class TestBatchResultDiskCache:
+    """Opt-in verify_batch disk cache: reuses counts, never trusts a bad entry."""
+
+    CITATIONS = ["Brown v. Board, 347 U.S. 483 (1954)", "Fake v. X, 999 XYZ 1"]
+
+    def test_disabled_by_default(self):
+        assert CitationGuard().cache_dir is None
+
+    def test_second_run_reads_cache(self, tmp_path):
+        first = CitationGuard(cache_dir=str(tmp_path)).verify_batch(self.CITATIONS)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        second = CitationGuard(cache_dir=str(tmp_path)).verify_batch(self.CITATIONS)
+        assert second == first
+        assert (second.format_valid, second.format_invalid) == (1, 1)
+
+    def test_different_lists_use_different_entries(self, tmp_path):
+        guard = CitationGuard(cache_dir=str(tmp_path))
+        guard.verify_batch(self.CITATIONS)
+        guard.verify_batch(self.CITATIONS[:1])
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_key_covers_version_and_matcher(self, tmp_path, monkeypatch):
+        """An upgrade or a subclass with other case-name rules gets its own entry."""
+        from qwed_legal.guards import citation_guard
+
+        class NoCaseNames(CitationGuard):
+            _REQUIRES_CASE_NAME = frozenset()
+
+        guard = CitationGuard(cache_dir=str(tmp_path))
+        path = guard._batch_cache_path(self.CITATIONS)
+        assert NoCaseNames(cache_dir=str(tmp_path))._batch_cache_path(self.CITATIONS) != path
+        monkeypatch.setattr(citation_guard, "__version__", "0.0.0-test")
+        assert guard._batch_cache_path(self.CITATIONS) != path
+
+    def test_corrupt_entry_is_recomputed(self, tmp_path):
+        guard = CitationGuard(cache_dir=str(tmp_path))
+        guard.verify_batch(self.CITATIONS)
+        (entry,) = tmp_path.glob("*.json")
+        entry.write_text('{"total": 2, "format_valid": 2, "format_invalid": 5}')
+        result = guard.verify_batch(self.CITATIONS)
+        assert (result.format_valid, result.format_invalid) == (1, 1)
+        entry.write_text("not json")
+        assert guard.verify_batch(self.CITATIONS).format_valid == 1
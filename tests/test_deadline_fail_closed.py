@@ -8,14 +8,15 @@ Covers:
 - is_computable flag is correctly set
 """
 
-from qwed_legal import DeadlineGuard
+import pytest
 
 
 class TestDeadlineGuardFailClosed:
     """Issue #15: DeadlineGuard must not invent deadlines from ambiguous text."""
 
-    def setup_method(self):
-        self.guard = DeadlineGuard()
+    @pytest.fixture(autouse=True)
+    def _use_shared_guard(self, deadline_guard):
+        self.guard = deadline_guard
 
     # ── Ambiguous terms (no number, no unit) ──────────────────────
 
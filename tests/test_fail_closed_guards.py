@@ -162,6 +162,29 @@ class TestContradictionGuardFailClosed:
         assert result["verified"] is False
         assert result["status"] == "contradiction"
 
+    def test_contradiction_names_conflicting_clauses(self):
+        """The unsat core identifies the clauses in conflict, by id or by text."""
+        result = self.guard.verify_consistency(
+            [
+                Clause(
+                    text="Contract duration minimum 6 months.",
+                    category="DURATION",
+                    value=6,
+                ),
+                Clause(
+                    text="Liability capped at 5000.",
+                    category="LIABILITY",
+                    value=5000,
+                    id="cap",
+                ),
+                Clause(
+                    text="Penalty fixed at 10000.", category="LIABILITY", value=10000
+                ),
+            ]
+        )
+        assert result["status"] == "contradiction"
+        assert result["conflicts"] == ["cap", "Penalty fixed at 10000."]
+
     def test_consistent_duration_clauses_pass(self):
         """Non-contradictory DURATION clauses must return consistent."""
         result = self.guard.verify_consistency(
@@ -197,6 +220,40 @@ class TestContradictionGuardFailClosed:
         assert result["verified"] is True
         assert result["status"] == "consistent"
 
+    def test_constraints_do_not_leak_between_calls(self):
+        """A reused guard must discard one call's constraints before the next."""
+        contradiction = self.guard.verify_consistency(
+            [
+                Clause(text="Duration exactly 12 months.", category="DURATION", value=12),
+                Clause(text="Duration exactly 24 months.", category="DURATION", value=24),
+            ]
+        )
+        assert contradiction["status"] == "contradiction"
+        result = self.guard.verify_consistency(
+            [Clause(text="Duration exactly 24 months.", category="DURATION", value=24)]
+        )
+        assert result["verified"] is True
+        assert result["status"] == "consistent"
+
+    def test_shared_guard_across_threads(self):
+        """Concurrent calls on one guard never see each other's clauses."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def check(months):
+            return self.guard.verify_consistency(
+                [
+                    Clause(
+                        text=f"Duration exactly {months} months.",
+                        category="DURATION",
+                        value=months,
+                    )
+                ]
+            )["status"]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            statuses = list(executor.map(check, range(1, 41)))
+        assert statuses == ["consistent"] * 40
+
     def test_unsupported_key_in_result(self):
         """Result must always include 'unsupported' key listing skipped categories."""
         result = self.guard.verify_consistency(
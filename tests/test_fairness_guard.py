@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from qwed_legal.guards.fairness_guard import (
     FairnessGuard,
@@ -16,9 +18,10 @@ class MockLLMClient:
 
     def generate(self, prompt: str) -> str:
         self.call_history.append(prompt)
-        if prompt not in self.responses:
-            raise KeyError(f"MockLLMClient received unexpected prompt: {prompt!r}")
-        return self.responses[prompt]
+        try:
+            return self.responses[prompt]
+        except KeyError:
+            raise KeyError(f"MockLLMClient received unexpected prompt: {prompt!r}") from None
 
 
 def test_fairness_guard_consistent_is_never_verified():
@@ -145,3 +148,63 @@ def test_fairness_guard_handles_none_from_llm():
     assert result["verified"] is False
     assert result["risk"] == RISK_LLM_GENERATION_FAILED
     assert result["status"] == STATUS_LLM_GENERATION_FAILED
+
+
+class AsyncMockLLMClient(MockLLMClient):
+    async def agenerate(self, prompt: str) -> str:
+        return self.generate(prompt)
+
+
+def test_fairness_guard_async_generates_both_decisions():
+    llm = AsyncMockLLMClient({
+        "Should we approve the loan for John?": "APPROVED",
+        "Should we approve the loan for Jane?": "DENIED",
+    })
+    guard = FairnessGuard(llm_client=llm)
+
+    result = asyncio.run(
+        guard.verify_decision_fairness_async(
+            "Should we approve the loan for John?", {"John": "Jane"}
+        )
+    )
+
+    assert result["verified"] is False
+    assert result["risk"] == RISK_HEURISTIC_BIAS_SIGNAL
+    assert sorted(llm.call_history) == [
+        "Should we approve the loan for Jane?",
+        "Should we approve the loan for John?",
+    ]
+
+
+def test_fairness_guard_async_falls_back_to_sync_client():
+    llm = MockLLMClient({"Should we approve the loan for Jane?": "APPROVED"})
+    guard = FairnessGuard(llm_client=llm)
+
+    result = asyncio.run(
+        guard.verify_decision_fairness_async(
+            "Should we approve the loan for John?",
+            {"John": "Jane"},
+            original_decision="APPROVED",
+        )
+    )
+
+    assert result["verified"] is False
+    assert result["status"] == STATUS_UNVERIFIABLE_FAIRNESS
+    assert llm.call_history == ["Should we approve the loan for Jane?"]
+
+
+def test_fairness_guard_async_handles_none_original_decision():
+    llm = AsyncMockLLMClient({
+        "Should we approve the loan for John?": None,
+        "Should we approve the loan for Jane?": "APPROVED",
+    })
+    guard = FairnessGuard(llm_client=llm)
+
+    result = asyncio.run(
+        guard.verify_decision_fairness_async(
+            "Should we approve the loan for John?", {"John": "Jane"}
+        )
+    )
+
+    assert result["verified"] is False
+    assert result["status"] == STATUS_LLM_GENERATION_FAILED
@@ -1,9 +1,14 @@
 """Tests for QWED-Legal guards."""
 
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from dateutil.relativedelta import relativedelta
+from hypothesis import example, given, strategies as st
 from z3 import Int, unknown as z3_unknown
 
 from qwed_legal import (
@@ -18,60 +23,156 @@ from qwed_legal import (
 class TestDeadlineGuard:
     """Test DeadlineGuard functionality."""
 
-    def test_calendar_days_correct(self):
-        """Test correct calendar day calculation."""
-        guard = DeadlineGuard()
-        result = guard.verify("2026-01-15", "30 days", "2026-02-14")
+    @pytest.mark.parametrize(
+        "signing_date, term, claimed_deadline",
+        [
+            pytest.param("2026-01-15", "30 days", "2026-02-14", id="calendar_days"),
+            # Feb 28, 2024 (leap year) + 1 day = Feb 29
+            pytest.param("2024-02-28", "1 day", "2024-02-29", id="leap_year"),
+            pytest.param("2026-01-15", "2 weeks", "2026-01-29", id="weeks"),
+            pytest.param("2026-01-15", "3 months", "2026-04-15", id="months"),
+            # Month and year shifts clamp to the last day of the target month
+            pytest.param("2024-01-31", "1 month", "2024-02-29", id="month_end_leap"),
+            pytest.param("2024-02-29", "1 year", "2025-02-28", id="leap_day_year"),
+        ],
+    )
+    def test_correct_deadline_verifies(
+        self, deadline_guard, signing_date, term, claimed_deadline
+    ):
+        """Test correct calendar, leap-year, week and month calculations."""
+        result = deadline_guard.verify(signing_date, term, claimed_deadline)
+        assert result.verified is True
+
+    @given(
+        start=st.dates(min_value=date(1900, 1, 1), max_value=date(2100, 12, 31)),
+        n=st.integers(1, 3650),
+    )
+    @example(start=date(2024, 2, 28), n=1)
+    def test_calendar_days_property(self, deadline_guard, start, n):
+        """N calendar days always lands exactly N days after the start."""
+        result = deadline_guard.verify(start, f"{n} days", start + timedelta(days=n))
         assert result.verified is True
 
-    def test_calendar_days_wrong(self):
+    @given(
+        start=st.dates(min_value=date(1900, 1, 1), max_value=date(2100, 12, 31)),
+        n=st.integers(1, 120),
+    )
+    @example(start=date(2024, 1, 31), n=1)
+    @example(start=date(2024, 2, 29), n=12)
+    def test_months_property_matches_relativedelta(self, deadline_guard, start, n):
+        """Month terms agree with dateutil's relativedelta, including month-end clamps."""
+        result = deadline_guard.verify(start, f"{n} months", start + relativedelta(months=n))
+        assert result.verified is True
+
+    def test_pre_parsed_dates_skip_parsing(self, deadline_guard):
+        """Test date and datetime inputs verify like their ISO strings."""
+        result = deadline_guard.verify(date(2026, 1, 15), "30 days", datetime(2026, 2, 14))
+        assert result.verified is True
+        assert result.signing_date == datetime(2026, 1, 15)
+        assert deadline_guard.calculate_business_days_between(
+            date(2026, 1, 15), "2026-01-22"
+        ) == deadline_guard.calculate_business_days_between("2026-01-15", "2026-01-22")
+
+    def test_calendar_days_wrong(self, deadline_guard):
         """Test incorrect calendar day calculation."""
-        guard = DeadlineGuard()
-        result = guard.verify("2026-01-15", "30 days", "2026-02-10")
+        result = deadline_guard.verify("2026-01-15", "30 days", "2026-02-10")
         assert result.verified is False
         assert "mismatch" in result.message.lower()
 
-    def test_business_days(self):
+    def test_business_days(self, deadline_guard):
         """Test business day calculation excludes weekends."""
-        guard = DeadlineGuard()
         # 30 business days from Jan 15, 2026 should be around Feb 27
-        result = guard.verify("2026-01-15", "30 business days", "2026-02-27")
+        result = deadline_guard.verify("2026-01-15", "30 business days", "2026-02-27")
         # Allow some tolerance for holidays (varies by year/region)
         assert result.difference_days <= 5
 
-    def test_leap_year(self):
-        """Test leap year handling."""
+    def test_business_days_skip_holidays_across_year_end(self, deadline_guard):
+        """Christmas and New Year's Day are skipped, not just weekends."""
+        # Mon 2025-12-22 + 5 business days: 23, 24, 26, 29, 30 (25th is Christmas)
+        add = deadline_guard._add_business_days
+        assert add(datetime(2025, 12, 22), 5) == datetime(2025, 12, 30)
+        # ...and 7 business days skips New Year's Day too: 31, then Jan 2
+        assert add(datetime(2025, 12, 22), 7) == datetime(2026, 1, 2)
+
+    def test_business_days_between_matches_day_by_day_count(self, deadline_guard):
+        """Arithmetic count agrees with stepping through every day of a long span."""
+        start, end = datetime(2023, 3, 17), datetime(2026, 8, 2)
+        expected = sum(
+            1
+            for i in range(1, (end - start).days + 1)
+            if (start + timedelta(days=i)).weekday() < 5
+            and (start + timedelta(days=i)) not in deadline_guard.holiday_calendar
+        )
+        between = deadline_guard.calculate_business_days_between
+        assert between("2023-03-17", "2026-08-02") == expected
+        assert between("2026-08-02", "2023-03-17") == expected
+
+    def test_repeated_terms_reuse_cached_deadline(self):
+        """Identical (date, term) pairs are computed once per guard."""
         guard = DeadlineGuard()
-        # Feb 28, 2024 (leap year) + 1 day = Feb 29
-        result = guard.verify("2024-02-28", "1 day", "2024-02-29")
-        assert result.verified is True
+        first = guard.verify("2026-01-15", "30 business days", "2026-02-27")
+        second = guard.verify("2026-01-15", "  30 Business Days ", "2026-02-27")
+        assert second.computed_deadline == first.computed_deadline
+        assert guard._deadline_cache.cache_info().hits == 1
 
-    def test_weeks(self):
-        """Test week calculations."""
+    def test_cached_deadline_respects_timezone(self):
+        """Same-instant starts in different zones keep their own deadlines."""
         guard = DeadlineGuard()
-        result = guard.verify("2026-01-15", "2 weeks", "2026-01-29")
+        guard.verify(
+            "2026-01-16T23:00-05:00", "1 business day", "2026-01-20T23:00-05:00"
+        )
+        result = guard.verify(
+            "2026-01-17T04:00+00:00", "1 business day", "2026-01-20T04:00+00:00"
+        )
         assert result.verified is True
 
-    def test_months(self):
-        """Test month calculations."""
+    def test_cached_deadline_sees_added_holidays(self):
+        """Holidays added to holiday_calendar invalidate cached deadlines."""
         guard = DeadlineGuard()
-        result = guard.verify("2026-01-15", "3 months", "2026-04-15")
+        assert guard.verify("2026-03-02", "3 business days", "2026-03-05").verified
+        guard.holiday_calendar.append({"2026-03-04": "Test Holiday"})
+        result = guard.verify("2026-03-02", "3 business days", "2026-03-06")
+        assert result.verified is True
+
+    def test_preload_years_builds_holiday_calendar_up_front(self):
+        """Requested years are populated at init; other years still load lazily."""
+        guard = DeadlineGuard(preload_years=range(2030, 2032))
+        assert {2030, 2031} <= guard.holiday_calendar.years
+        result = guard.verify("2023-12-22", "2 business days", "2023-12-27")
         assert result.verified is True
 
+    def test_lazy_years_populated_safely_across_threads(self):
+        """Threads reaching unbuilt years on one guard agree with a serial guard."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        starts = [datetime(year, 12, 20) for year in range(2000, 2020)]
+        expected = [
+            DeadlineGuard(preload_years=())._add_business_days(s, 10) for s in starts
+        ]
+        guard = DeadlineGuard(preload_years=())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda s: guard._add_business_days(s, 10), starts))
+        assert results == expected
+
 
 class TestLiabilityGuard:
     """Test LiabilityGuard functionality."""
 
-    def test_cap_correct(self):
+    @pytest.mark.parametrize(
+        "contract_value, cap_percentage, claimed_cap",
+        [
+            pytest.param(5_000_000, 200, 10_000_000, id="200_percent"),
+            pytest.param(1_000_000, 100, 1_000_000, id="100_percent"),
+        ],
+    )
+    def test_cap_correct(self, liability_guard, contract_value, cap_percentage, claimed_cap):
         """Test correct liability cap calculation."""
-        guard = LiabilityGuard()
-        result = guard.verify_cap(5_000_000, 200, 10_000_000)
+        result = liability_guard.verify_cap(contract_value, cap_percentage, claimed_cap)
         assert result.verified is True
 
-    def test_cap_wrong(self):
+    def test_cap_wrong(self, liability_guard):
         """Test incorrect liability cap calculation."""
-        guard = LiabilityGuard()
-        result = guard.verify_cap(5_000_000, 200, 15_000_000)
+        result = liability_guard.verify_cap(5_000_000, 200, 15_000_000)
         assert result.verified is False
         assert "mismatch" in result.message.lower()
 
@@ -97,15 +198,14 @@ class TestLiabilityGuard:
         assert result.verified is False
         assert result.difference == Decimal("900.00")
 
-    def test_cap_rounds_half_up_before_exact_comparison(self):
+    def test_cap_rounds_half_up_before_exact_comparison(self, liability_guard):
         """Exact verification follows modeled HALF_UP currency rounding."""
-        guard = LiabilityGuard()
 
-        exact = guard.verify_cap(Decimal("100000.005"), 100, Decimal("100000.01"))
+        exact = liability_guard.verify_cap(Decimal("100000.005"), 100, Decimal("100000.01"))
         assert exact.verified is True
         assert exact.computed_cap == Decimal("100000.01")
 
-        rounded_down = guard.verify_cap(
+        rounded_down = liability_guard.verify_cap(
             Decimal("100000.005"), 100, Decimal("100000.00")
         )
         assert rounded_down.verified is False
@@ -113,21 +213,14 @@ class TestLiabilityGuard:
         assert rounded_down.difference == Decimal("0.01")
         assert "tolerance is not accepted" in rounded_down.message.lower()
 
-    def test_cap_100_percent(self):
-        """Test 100% liability cap."""
-        guard = LiabilityGuard()
-        result = guard.verify_cap(1_000_000, 100, 1_000_000)
-        assert result.verified is True
-
-    def test_tiered_liability(self):
+    def test_tiered_liability(self, liability_guard):
         """Test tiered liability calculation."""
-        guard = LiabilityGuard()
         tiers = [
             {"base": 1_000_000, "percentage": 100},
             {"base": 500_000, "percentage": 50},
         ]
         # 1M * 100% + 500K * 50% = 1M + 250K = 1.25M
-        result = guard.verify_tiered_liability(tiers, 1_250_000)
+        result = liability_guard.verify_tiered_liability(tiers, 1_250_000)
         assert result.verified is True
 
     def test_tiered_liability_close_enough_is_not_verified(self):
@@ -141,17 +234,17 @@ class TestLiabilityGuard:
         assert result.claimed_total == Decimal("100900.0")
         assert "tolerance is not accepted" in result.message.lower()
 
-    def test_indemnity_limit(self):
+    @pytest.mark.parametrize(
+        "claimed_limit, verified",
+        [
+            pytest.param(300_000, True, id="correct"),
+            pytest.param(400_000, False, id="wrong"),
+        ],
+    )
+    def test_indemnity_limit(self, liability_guard, claimed_limit, verified):
         """Test indemnity limit calculation (3x annual fee)."""
-        guard = LiabilityGuard()
-        result = guard.verify_indemnity_limit(100_000, 3, 300_000)
-        assert result.verified is True
-
-    def test_indemnity_limit_wrong(self):
-        """Test incorrect indemnity limit."""
-        guard = LiabilityGuard()
-        result = guard.verify_indemnity_limit(100_000, 3, 400_000)
-        assert result.verified is False
+        result = liability_guard.verify_indemnity_limit(100_000, 3, claimed_limit)
+        assert result.verified is verified
 
     def test_indemnity_limit_close_enough_is_not_verified(self):
         """Indemnity limit verification must not accept approximate values."""
@@ -193,6 +286,20 @@ class TestClauseGuard:
         assert result.consistent is False
         assert len(result.conflicts) >= 1
 
+    def test_conflicts_reported_in_clause_order_among_unrelated_clauses(self):
+        """Conflict pairs keep their original indices and scan order."""
+        guard = ClauseGuard()
+        filler = ["Buyer shall pay upon receipt"] * 5
+        clauses = (
+            ["Seller may terminate with 30 days notice"]
+            + filler
+            + ["Neither party may terminate before 90 days"]
+            + filler
+            + ["Licensee has exclusive rights", "Licensee has exclusive distribution"]
+        )
+        result = guard.check_consistency(clauses)
+        assert [(i, j) for i, j, _ in result.conflicts] == [(0, 6), (12, 13)]
+
     def test_single_clause(self):
         """Test single clause (no conflict possible)."""
         guard = ClauseGuard()
@@ -255,6 +362,14 @@ class TestClauseGuard:
         assert result.consistent is False
         assert any("minimum term" in reason for _, _, reason in result.conflicts)
 
+    def test_notice_days_prefer_days_before_context_word(self):
+        """"N days notice" wins over an earlier "notice N days", across line breaks."""
+        guard = ClauseGuard()
+        text = "notice 10 days for cure.\nseller may terminate with 30 days notice"
+        assert guard._extract_days(text, "notice") == 30
+        assert guard._extract_days("notice 10 days", "notice") == 10
+        assert guard._extract_days("no day count given", "notice") is None
+
     def test_exclusivity_conflict_for_same_party(self):
         """Exclusive rights granted twice to the same modeled party should conflict."""
         guard = ClauseGuard()
@@ -267,6 +382,18 @@ class TestClauseGuard:
         assert result.consistent is False
         assert any("exclusive rights" in reason for _, _, reason in result.conflicts)
 
+    def test_exclusive_clauses_paired_only_when_sharing_a_party(self):
+        """Exclusive clauses naming different parties are never candidate pairs."""
+        guard = ClauseGuard()
+        propositions = guard._extract_propositions(
+            [
+                "Seller has exclusive rights in Region A.",
+                "Buyer has exclusive rights in Region B.",
+                "Seller and Buyer have exclusive rights in Region C.",
+            ]
+        )
+        assert guard._candidate_pairs(propositions) == [(0, 2), (1, 2)]
+
     def test_verify_using_z3_rejects_raw_text_constraints(self):
         """Raw text constraints should fail closed instead of pretending to be proven."""
         guard = ClauseGuard()
@@ -302,6 +429,28 @@ class TestClauseGuard:
         assert result.consistent is False
         assert "unsatisfiable" in result.message.lower()
 
+    def test_verify_using_z3_discards_constraints_between_calls(self):
+        """A reused guard must not carry one call's constraints into the next."""
+        guard = ClauseGuard()
+        months = Int("months")
+        assert guard.verify_using_z3([months == 12]).consistent is True
+        assert guard.verify_using_z3([months == 24]).consistent is True
+
+    def test_verify_using_z3_shared_across_threads(self):
+        """Concurrent calls on one guard never see each other's constraints."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        guard = ClauseGuard()
+        months = Int("months")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda n: guard.verify_using_z3([months == n]).consistent,
+                    range(40),
+                )
+            )
+        assert all(results)
+
     def test_verify_using_z3_handles_unknown_fail_closed(self):
         """Z3 unknown must not default to consistent."""
         guard = ClauseGuard()
@@ -378,6 +527,31 @@ class TestCitationGuard:
         assert result.parsed_components.get("title") == 42
 
 
+class TestLazyImports:
+    """Package exports resolve lazily; unused guards (and Z3) are not loaded."""
+
+    def test_citation_guard_import_does_not_load_z3(self):
+        code = (
+            "import sys; from qwed_legal import CitationGuard; "
+            "assert 'z3' not in sys.modules, 'z3 imported eagerly'; "
+            "assert 'qwed_legal.guards.clause_guard' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazy_exports_match_submodules(self):
+        import qwed_legal
+        from qwed_legal.guards.citation_guard import CitationGuard as Direct
+
+        assert qwed_legal.CitationGuard is Direct
+        assert set(qwed_legal.__all__) <= set(dir(qwed_legal))
+
+    def test_unknown_attribute_raises(self):
+        import qwed_legal
+
+        with pytest.raises(AttributeError):
+            getattr(qwed_legal, "NotAGuard")
+
+
 class TestLegalGuard:
     """Test the all-in-one LegalGuard."""
 
@@ -450,6 +624,23 @@ class TestJurisdictionGuard:
         # Should detect conflict
         assert len(result.conflicts) > 0 or len(result.warnings) > 0
 
+    def test_issue_codes_parallel_conflicts_and_warnings(self):
+        """Each conflict/warning carries a machine-readable issue code."""
+        from qwed_legal.guards.jurisdiction_guard import JurisdictionGuard, JurisdictionIssue
+
+        guard = JurisdictionGuard()
+        result = guard.verify_choice_of_law(
+            parties_countries=["US", "DE"], governing_law="Delaware", forum="London"
+        )
+        assert result.issues == [
+            JurisdictionIssue.CROSS_LEGAL_SYSTEM,
+            JurisdictionIssue.US_LAW_NON_US_FORUM,
+            JurisdictionIssue.CISG_MAY_APPLY,
+            JurisdictionIssue.HOME_JURISDICTION_LAW,
+        ]
+        assert len(result.issues) == len(result.conflicts) + len(result.warnings)
+        assert guard.verify_forum_selection("NY", contract_value=100000).issues == []
+
     def test_cisg_applicability(self):
         """Test CISG convention check."""
         from qwed_legal import JurisdictionGuard
@@ -461,6 +652,28 @@ class TestJurisdictionGuard:
         assert result.verified is True
         assert "applies" in result.message.lower()
 
+    def test_repeated_convention_check_reuses_membership(self):
+        """Same convention and parties are resolved once; non-members keep input order."""
+        from qwed_legal import JurisdictionGuard
+
+        guard = JurisdictionGuard()
+        first = guard.check_convention_applicability(["ZZ", "us", "KR"], "CISG")
+        second = guard.check_convention_applicability([" ZZ", "US", "kr "], "cisg")
+        assert first.warnings == ["Not all parties are CISG members: ['ZZ', 'KR']"]
+        assert second.verified is False
+        assert guard._membership_cache.cache_info().hits == 1
+
+    def test_guards_share_lookup_tables_but_honor_subclass_tables(self):
+        """Instances reuse derived tables; a subclass with its own tables gets its own."""
+        from qwed_legal.guards.jurisdiction_guard import JurisdictionGuard
+
+        class WithPuertoRico(JurisdictionGuard):
+            US_STATES = JurisdictionGuard.US_STATES | {"PR"}
+
+        assert JurisdictionGuard()._jurisdiction_kind is JurisdictionGuard()._jurisdiction_kind
+        assert not JurisdictionGuard()._is_us_state("PR")
+        assert WithPuertoRico()._is_us_state("PR")
+
     def test_forum_selection(self):
         """Test forum selection validation."""
         from qwed_legal import JurisdictionGuard
@@ -501,6 +714,46 @@ class TestStatuteOfLimitationsGuard:
         assert result.verified is False
         assert "EXPIRED" in result.message
 
+    def test_leap_day_incident_clamps_to_month_end(self):
+        """Test a Feb 29 incident expires on Feb 28 in a non-leap year."""
+        from qwed_legal import StatuteOfLimitationsGuard
+
+        guard = StatuteOfLimitationsGuard()
+        result = guard.verify(
+            claim_type="breach_of_contract",
+            jurisdiction="New York",
+            incident_date="2020-02-29",
+            filing_date="2026-03-01",
+        )
+        assert result.expiration_date == datetime(2026, 2, 28)
+        assert result.days_remaining == -1
+        assert result.verified is False
+
+    def test_repeated_dates_are_parsed_once(self):
+        """Test repeat verifications reuse the parsed date strings."""
+        from qwed_legal import StatuteOfLimitationsGuard
+        from qwed_legal.guards._dates import _parse_date_str
+
+        guard = StatuteOfLimitationsGuard()
+        first = guard.verify("fraud", "California", "2021-03-04", "2023-05-06")
+        hits = _parse_date_str.cache_info().hits
+        second = guard.verify("fraud", "California", "2021-03-04", "2023-05-06")
+        assert _parse_date_str.cache_info().hits == hits + 2
+        assert second.expiration_date == first.expiration_date
+        assert second.verification_trace is not first.verification_trace
+
+    def test_statute_result_is_frozen(self):
+        """Test a verdict cannot be flipped after verify() returns it."""
+        import dataclasses
+        from qwed_legal import StatuteOfLimitationsGuard
+
+        guard = StatuteOfLimitationsGuard()
+        result = guard.verify("fraud", "California", "2010-01-01", "2023-05-06")
+        assert result.verified is False
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.verified = True
+        assert not hasattr(result, "__dict__")
+
     def test_get_limitation_period(self):
         """Test getting limitation period."""
         from qwed_legal import StatuteOfLimitationsGuard
@@ -102,3 +102,17 @@ def test_verify_structure_backward_compat():
     assert isinstance(result, dict)
     assert result["verified"] is False
     assert "status" in result
+
+
+def test_irac_sections_found_after_preamble_and_mid_line_keywords():
+    """Headings are located wherever they start a line, not where keywords merely appear."""
+    guard = IRACGuard()
+    analysis = """The rule of thumb in this memo is brevity.
+    **Issue**: Was notice timely?
+    Rule: Notice must arrive within thirty days.
+    Conclusion: Notice was timely."""
+    result = guard.verify(analysis)
+    assert result.status == STATUS_STRUCTURE_INVALID
+    assert result.missing_sections == ["application"]
+    assert result.components["issue"] == "Was notice timely?"
+    assert result.components["rule"] == "Notice must arrive within thirty days."